@@ -1,2 +1,9 @@
 from .base import Base
-from .session import SessionLocal, engine
\ No newline at end of file
+from .session import SessionLocal, dispose_engines, get_engine, get_sessionmaker
+
+
+def __getattr__(name):
+    # `from db import engine` crée l'engine par défaut à la première utilisation
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
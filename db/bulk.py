@@ -0,0 +1,122 @@
+import io
+from contextlib import contextmanager
+
+from sqlalchemy import column, literal_column, select, text
+from sqlalchemy import table as table_clause
+
+from db.upsert import dialect_insert
+
+
+def copy_insert(session, table, df, conflict_columns):
+    """
+    PostgreSQL : COPY FROM STDIN de df dans une table de staging
+    temporaire, puis un seul INSERT ... SELECT ... ON CONFLICT DO NOTHING
+    vers `table`. Retourne le nombre de lignes insérées.
+    """
+    columns = ", ".join(df.columns)
+    staging = f"staging_{table.name}"
+    connection = session.connection()
+
+    connection.execute(text(
+        f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS "
+        f"AS SELECT {columns} FROM {table.name} WITH NO DATA"
+    ))
+    connection.execute(text(f"TRUNCATE {staging}"))
+
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {staging} ({columns}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
+    result = connection.execute(text(
+        f"INSERT INTO {table.name} ({columns}) "
+        f"SELECT {columns} FROM {staging} "
+        f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+    ))
+    return result.rowcount
+
+
+@contextmanager
+def registered_frame(session, df, name):
+    """
+    DuckDB : expose df comme vue `name` (scan direct du DataFrame, sans
+    conversion ligne à ligne) le temps du bloc. Renvoie la table
+    SQLAlchemy correspondante, utilisable dans un SELECT.
+    """
+    driver_connection = session.connection().connection.driver_connection
+    driver_connection.register(name, df)
+    try:
+        yield table_clause(name, *(column(col) for col in df.columns))
+    finally:
+        driver_connection.unregister(name)
+
+
+def execute_frame(session, stmt, df):
+    """
+    Exécute l'INSERT stmt (construit par dialect_insert, ON CONFLICT
+    éventuel compris) pour toutes les lignes de df.
+    DuckDB : une seule instruction INSERT ... SELECT sur une vue du
+    DataFrame (son executemany prépare une exécution par ligne).
+    Autres dialectes : executemany, valeurs manquantes -> NULL.
+    Retourne le nombre de lignes envoyées.
+    """
+    if df.empty:
+        return 0
+
+    if session.get_bind().dialect.name == "duckdb":
+        with registered_frame(session, df, f"staging_{stmt.table.name}") as staging:
+            session.execute(stmt.from_select(list(df.columns), select(staging)))
+        return len(df)
+
+    session.execute(stmt, df.astype(object).where(df.notna(), None).to_dict("records"))
+    return len(df)
+
+
+def duckdb_insert(session, table, df, conflict_columns):
+    """
+    DuckDB : un seul INSERT ... SELECT ... ON CONFLICT DO NOTHING depuis
+    une vue sur df. Retourne le nombre de lignes insérées.
+    """
+    stmt = dialect_insert(session, table).on_conflict_do_nothing(
+        index_elements=conflict_columns
+    )
+    with registered_frame(session, df, f"staging_{table.name}") as staging:
+        # rowcount non renseigné par duckdb_engine : RETURNING des lignes insérées
+        result = session.execute(
+            stmt.from_select(list(df.columns), select(staging))
+            .returning(literal_column("1"))
+        )
+        return len(result.all())
+
+
+def bulk_insert(session, table, df, conflict_columns):
+    """
+    Insère toutes les lignes de df dans `table` en ignorant celles qui
+    violent la contrainte d'unicité sur conflict_columns.
+    COPY sur PostgreSQL, vue sur le DataFrame sur DuckDB, INSERT en
+    executemany sinon.
+    Retourne le nombre de lignes insérées.
+    """
+    if df.empty:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return copy_insert(session, table, df, conflict_columns)
+    if dialect == "duckdb":
+        return duckdb_insert(session, table, df, conflict_columns)
+
+    # executemany : requête compilée une seule fois, lots gérés par le driver
+    stmt = dialect_insert(session, table).on_conflict_do_nothing(
+        index_elements=conflict_columns
+    )
+    result = session.execute(stmt, df.to_dict("records"))
+    return max(result.rowcount, 0)
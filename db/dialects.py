@@ -0,0 +1,99 @@
+from sqlalchemy import ForeignKeyConstraint, Table, event, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn
+
+# =====================================================
+# Backends embarqués (SQLite, DuckDB)
+# =====================================================
+# Les modèles sont écrits pour PostgreSQL. SQLite les accepte tels quels
+# (Enum -> VARCHAR + CHECK, ON CONFLICT natif). DuckDB (dialecte
+# duckdb_engine, dérivé de PostgreSQL) demande trois adaptations de DDL,
+# appliquées ici à la compilation, sans toucher aux modèles :
+#   - pas de SERIAL : les clés auto-incrémentées prennent leur valeur
+#     d'une séquence <table>_<colonne>_seq créée avec la table ;
+#   - pas de clés étrangères : DuckDB refuse CASCADE et toute mise à jour
+#     d'une ligne référencée (upsert des départements). L'intégrité est
+#     vérifiée avant insertion (utils/validation.py, règle
+#     fk_code_dept_inconnu) ;
+#   - les types ENUM natifs (CREATE TYPE ... AS ENUM) sont conservés.
+EMBEDDED_BACKENDS = {"sqlite", "duckdb"}
+
+
+def backend_name(bind):
+    """Nom du dialecte d'une session, connexion ou engine."""
+    get_bind = getattr(bind, "get_bind", None)
+    return (get_bind() if get_bind else bind).dialect.name
+
+
+def is_embedded(bind):
+    return backend_name(bind) in EMBEDDED_BACKENDS
+
+
+def sequence_name(column):
+    return f"{column.table.name}_{column.name}_seq"
+
+
+def is_sequence_column(column):
+    return (
+        column is column.table.autoincrement_column
+        and column.default is None
+        and column.server_default is None
+    )
+
+
+@compiles(CreateColumn, "duckdb")
+def duckdb_create_column(element, compiler, **kw):
+    column = element.element
+    if not is_sequence_column(column):
+        return compiler.visit_create_column(element, **kw)
+    return (
+        f"{compiler.preparer.format_column(column)} "
+        f"{compiler.dialect.type_compiler_instance.process(column.type)} "
+        f"DEFAULT nextval('{sequence_name(column)}') NOT NULL"
+    )
+
+
+@compiles(ForeignKeyConstraint, "duckdb")
+def duckdb_foreign_key(element, compiler, **kw):
+    return None
+
+
+@event.listens_for(Table, "before_create")
+def create_sequences(table, connection, **kw):
+    if connection.dialect.name != "duckdb":
+        return
+    for column in table.columns:
+        if is_sequence_column(column):
+            connection.execute(text(
+                f"CREATE SEQUENCE IF NOT EXISTS {sequence_name(column)}"
+            ))
+
+
+@event.listens_for(Table, "after_drop")
+def drop_sequences(table, connection, **kw):
+    if connection.dialect.name != "duckdb":
+        return
+    for column in table.columns:
+        if is_sequence_column(column):
+            connection.execute(text(f"DROP SEQUENCE IF EXISTS {sequence_name(column)}"))
+
+
+# =====================================================
+# Réglages de connexion
+# =====================================================
+def sqlite_pragmas(read_only=False):
+    """
+    Listener "connect" pour SQLite : clés étrangères appliquées (comme
+    sur PostgreSQL), journal WAL et attente des verrous plutôt qu'une
+    erreur immédiate ; query_only pour les profils en lecture seule.
+    """
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+    return on_connect
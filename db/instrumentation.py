@@ -0,0 +1,254 @@
+import atexit
+import json
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import re
+import time
+from functools import lru_cache
+
+from sqlalchemy import event
+
+# =====================================================
+# Instrumentation SQL (optionnelle)
+# =====================================================
+# Activée par la variable d'environnement DB_INSTRUMENT :
+#   DB_INSTRUMENT=1            résumé affiché à la sortie du processus
+#   DB_INSTRUMENT=stats.json   résumé écrit en JSON (un fichier par
+#                              processus worker : stats-<pid>.json)
+# DB_N_PLUS_ONE : nombre d'exécutions unitaires (hors executemany) d'une
+#                 même requête dans une transaction à partir duquel un
+#                 N+1 est signalé (50 par défaut).
+#
+# Par forme de requête (texte SQL normalisé : listes VALUES et IN
+# repliées, espaces compactés) : nombre d'appels, temps total et max,
+# histogramme des latences (seaux en puissances de 2 de µs), lignes
+# affectées (ou renvoyées, si le driver les annonce). Coût par requête :
+# deux perf_counter, une recherche en cache de la forme et quelques
+# additions.
+
+N_BUCKETS = 32
+DEFAULT_N_PLUS_ONE = 50
+
+VALUES_LIST = re.compile(r"(VALUES\s*\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+IN_LIST = re.compile(r"\bIN\s*\((?:[^()]*,)+[^()]*\)", re.IGNORECASE)
+WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def statement_shape(statement):
+    shape = WHITESPACE.sub(" ", statement).strip()
+    shape = VALUES_LIST.sub(r"\1, ...", shape)
+    return IN_LIST.sub("IN (...)", shape)
+
+
+def bucket_of(seconds):
+    micros = max(int(seconds * 1_000_000), 1)
+    return min(micros.bit_length() - 1, N_BUCKETS - 1)
+
+
+def bucket_upper_ms(index):
+    return (1 << (index + 1)) / 1000
+
+
+class ShapeStats:
+    __slots__ = ("calls", "total", "max", "rows", "buckets", "max_per_transaction")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.buckets = [0] * N_BUCKETS
+        self.max_per_transaction = 0
+
+    def percentile_ms(self, fraction):
+        """
+        Borne haute du seau contenant le quantile demandé, plafonnée au
+        maximum mesuré (un quantile ne dépasse jamais max_ms).
+        """
+        target = math.ceil(self.calls * fraction)
+        seen = 0
+        index = N_BUCKETS - 1
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                index = bucket
+                break
+        return min(bucket_upper_ms(index), round(self.max * 1000, 3))
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3),
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": round(self.max * 1000, 3),
+            "rows": self.rows,
+            "max_per_transaction": self.max_per_transaction,
+            "histogram_us": {
+                f"<{1 << (index + 1)}": count
+                for index, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class SqlInstrumentation:
+    """
+    Collecteur branché sur before/after_cursor_execute d'un ou plusieurs
+    engines. L'instant de départ est porté par le contexte d'exécution ;
+    les compteurs par transaction (détection N+1) sont gardés dans
+    connection.info et remis à zéro au commit / rollback.
+    """
+
+    def __init__(self, n_plus_one=DEFAULT_N_PLUS_ONE):
+        self.n_plus_one = n_plus_one
+        self.shapes = {}
+        self.started = time.perf_counter()
+        self.reported = False
+
+    # =====================================================
+    # Événements
+    # =====================================================
+    def attach(self, engine):
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self.after_cursor_execute)
+        event.listen(engine, "commit", self.end_transaction)
+        event.listen(engine, "rollback", self.end_transaction)
+        return engine
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters,
+                              context, executemany):
+        context._instrumentation_start = time.perf_counter()
+
+    def after_cursor_execute(self, conn, cursor, statement, parameters,
+                             context, executemany):
+        elapsed = time.perf_counter() - context._instrumentation_start
+
+        shape = statement_shape(statement)
+        stats = self.shapes.get(shape)
+        if stats is None:
+            stats = self.shapes[shape] = ShapeStats()
+
+        stats.calls += 1
+        stats.total += elapsed
+        if elapsed > stats.max:
+            stats.max = elapsed
+        stats.buckets[bucket_of(elapsed)] += 1
+        if cursor.rowcount > 0:
+            stats.rows += cursor.rowcount
+
+        # N+1 : même requête unitaire répétée dans une transaction
+        # (SELECT par ligne, INSERT ligne à ligne...)
+        if not executemany:
+            per_transaction = conn.info.setdefault("instrumentation_calls", {})
+            count = per_transaction[shape] = per_transaction.get(shape, 0) + 1
+            if count > stats.max_per_transaction:
+                stats.max_per_transaction = count
+
+    def reset_for_child(self, destination):
+        """Processus fils : compteurs propres, résumé écrit à sa sortie."""
+        self.shapes = {}
+        self.started = time.perf_counter()
+        self.reported = False
+        report_at_exit(self, destination)
+
+    def end_transaction(self, conn):
+        conn.info.pop("instrumentation_calls", None)
+
+    # =====================================================
+    # Résumé
+    # =====================================================
+    def n_plus_one_shapes(self):
+        return [
+            shape for shape, stats in self.shapes.items()
+            if stats.max_per_transaction >= self.n_plus_one
+        ]
+
+    def summary(self):
+        shapes = sorted(self.shapes.items(), key=lambda item: item[1].total, reverse=True)
+        return {
+            "pid": os.getpid(),
+            "wall_s": round(time.perf_counter() - self.started, 3),
+            "sql_s": round(sum(stats.total for _, stats in shapes), 3),
+            "statements": sum(stats.calls for _, stats in shapes),
+            "n_plus_one": self.n_plus_one_shapes(),
+            "shapes": [{"sql": shape, **stats.as_dict()} for shape, stats in shapes],
+        }
+
+    def print_summary(self, top=15):
+        summary = self.summary()
+        print(
+            f"\n📊 SQL : {summary['statements']} requêtes, {summary['sql_s']} s "
+            f"sur {summary['wall_s']} s ({len(summary['shapes'])} formes)"
+        )
+        print(f"{'appels':>8} {'total ms':>10} {'p50':>8} {'p95':>8} {'max':>9} {'lignes':>9}  requête")
+        for shape in summary["shapes"][:top]:
+            print(
+                f"{shape['calls']:>8} {shape['total_ms']:>10.1f} {shape['p50_ms']:>8.3f} "
+                f"{shape['p95_ms']:>8.3f} {shape['max_ms']:>9.2f} {shape['rows']:>9}  "
+                f"{shape['sql'][:100]}"
+            )
+        for shape in summary["n_plus_one"]:
+            stats = self.shapes[shape]
+            print(
+                f"⚠️  N+1 probable : {stats.max_per_transaction} exécutions dans une "
+                f"transaction de {shape[:120]}"
+            )
+
+    def write_json(self, path):
+        if multiprocessing.parent_process() is not None:
+            root, extension = os.path.splitext(path)
+            path = f"{root}-{os.getpid()}{extension}"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def report(self, destination="1"):
+        if self.reported or not self.shapes:
+            return
+        self.reported = True
+        if destination == "1":
+            self.print_summary()
+        else:
+            print(f"📊 Statistiques SQL écrites dans {self.write_json(destination)}")
+
+
+# =====================================================
+# Activation par l'environnement
+# =====================================================
+_collector = None
+
+
+def report_at_exit(collector, destination):
+    # Les workers multiprocessing sortent par os._exit, sans atexit :
+    # leurs finaliseurs, eux, sont exécutés
+    multiprocessing.util.Finalize(
+        None, collector.report, args=(destination,), exitpriority=10
+    )
+
+
+def get_collector():
+    """Collecteur du processus si DB_INSTRUMENT est défini, sinon None."""
+    global _collector
+    destination = os.environ.get("DB_INSTRUMENT")
+    if not destination or destination == "0":
+        return None
+    if _collector is None:
+        _collector = SqlInstrumentation(
+            n_plus_one=int(os.environ.get("DB_N_PLUS_ONE", DEFAULT_N_PLUS_ONE))
+        )
+        atexit.register(_collector.report, destination)
+        report_at_exit(_collector, destination)
+        multiprocessing.util.register_after_fork(
+            _collector, lambda collector: collector.reset_for_child(destination)
+        )
+    return _collector
+
+
+def instrument(engine):
+    """Branche l'instrumentation sur engine si elle est activée."""
+    collector = get_collector()
+    return collector.attach(engine) if collector else engine
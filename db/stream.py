@@ -0,0 +1,62 @@
+import pandas as pd
+from sqlalchemy import select
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _connection(session_or_connection):
+    connection = getattr(session_or_connection, "connection", None)
+    return connection() if callable(connection) else session_or_connection
+
+
+def stream_frames(session, stmt, chunk_size=DEFAULT_CHUNK_SIZE, empty=False):
+    """
+    Exécute stmt (Core, pas de chargement ORM) sur un curseur serveur
+    (stream_results / yield_per) et itère des DataFrames d'au plus
+    chunk_size lignes, construits directement depuis les tuples du
+    paquet : ni instance ORM ni dict par ligne, un seul paquet en
+    mémoire à la fois. empty=True : un DataFrame vide (colonnes du
+    résultat) est produit si la requête ne renvoie aucune ligne.
+    """
+    # Options propres à cette instruction : la connexion de la session
+    # (et la suite de sa transaction) reste sans curseur serveur
+    result = _connection(session).execute(
+        stmt, execution_options={"stream_results": True, "yield_per": chunk_size}
+    )
+    columns = list(result.keys())
+    try:
+        produced = False
+        for rows in result.partitions(chunk_size):
+            produced = True
+            yield pd.DataFrame.from_records(rows, columns=columns)
+        if empty and not produced:
+            yield pd.DataFrame(columns=columns)
+    finally:
+        result.close()
+
+
+def stream_columns(session, stmt, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Comme stream_frames, en paquets {colonne: tableau numpy}."""
+    for frame in stream_frames(session, stmt, chunk_size):
+        yield {name: frame[name].to_numpy() for name in frame.columns}
+
+
+def read_frame(session, stmt, chunk_size=DEFAULT_CHUNK_SIZE, transform=None):
+    """
+    Commodité : DataFrame complet de stmt, lu par paquets puis concaténé.
+    Tous les paquets (après transform, appliqué à chacun) sont gardés
+    jusqu'à la concaténation : le pic mémoire est d'environ deux fois le
+    résultat complet. À réserver aux résultats qui tiennent en mémoire
+    (tables de dimension, stats) ; pour une table de faits, itérer
+    stream_frames et agréger paquet par paquet.
+    """
+    chunks = [
+        transform(chunk) if transform else chunk
+        for chunk in stream_frames(session, stmt, chunk_size, empty=True)
+    ]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def read_table(session, table, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Itère les paquets (DataFrames) d'une table entière."""
+    return stream_frames(session, select(table), chunk_size, empty=True)
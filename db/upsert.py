@@ -0,0 +1,17 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(session, model):
+    """
+    Construit un INSERT supportant ON CONFLICT pour le dialecte
+    de la session (PostgreSQL, SQLite ou DuckDB, dont la syntaxe
+    ON CONFLICT est celle de PostgreSQL).
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "duckdb"):
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(
+        f"ON CONFLICT non supporté pour le dialecte '{dialect}'"
+    )
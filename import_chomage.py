@@ -0,0 +1,38 @@
+# =====================================================
+# Import DB des taux de chômage trimestriels
+# =====================================================
+#
+# Usage :
+#   python import_chomage.py                      # fichier par défaut
+#   python import_chomage.py chemin/chomage.xlsx  # nouveau trimestre
+
+import argparse
+
+from db import SessionLocal
+from utils.chomage_importer import CHOMAGE_FILE, ChomageImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import des taux de chômage")
+    parser.add_argument("fichier", nargs="?", default=CHOMAGE_FILE)
+    args = parser.parse_args()
+
+    session = SessionLocal("bulk")
+    try:
+        importer = ChomageImporter(session=session)
+        resultat = importer.import_file(args.fichier)
+    finally:
+        session.close()
+
+    print(f"✅ {resultat['lignes']} taux importés")
+    if resultat["departements_inconnus"]:
+        print(
+            "⚠️  Départements absents de la base : "
+            + ", ".join(resultat["departements_inconnus"])
+        )
+    for cible, nb_lignes in sorted(importer.validator.quarantined.items()):
+        print(f"⚠️  {nb_lignes} ligne(s) mise(s) en quarantaine pour {cible}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# =====================================================
+# Import DB des tables de contexte national (utils/context_configs.py)
+# =====================================================
+#
+# Usage :
+#   python import_contexte.py                  # toutes les tables
+#   python import_contexte.py menage entreprise
+
+import argparse
+
+from db import SessionLocal
+from utils.context_configs import CONTEXT_SOURCES
+from utils.context_loader import ContextLoader
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import des tables de contexte")
+    parser.add_argument(
+        "tables",
+        nargs="*",
+        metavar="TABLE",
+        help=f"Tables à charger parmi {', '.join(CONTEXT_SOURCES)} (toutes par défaut)"
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.tables) - set(CONTEXT_SOURCES)
+    if unknown:
+        parser.error(f"table(s) inconnue(s) : {', '.join(sorted(unknown))}")
+
+    session = SessionLocal("bulk")
+    try:
+        resultats = ContextLoader(session=session).load_all(args.tables)
+    finally:
+        session.close()
+
+    for name, nb_annees in resultats.items():
+        print(f"✅ {name} : {nb_annees} années chargées")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# =====================================================
+# Import DB des élections configurées (utils/election_configs.py)
+# =====================================================
+#
+# Usage :
+#   python import_elections.py                          # toutes les élections
+#   python import_elections.py presidentielle-2022      # une élection
+#   python import_elections.py presidentielle-2012 --tours 2 --force
+#   python import_elections.py --workers 6            # un processus par tour
+#   python import_elections.py presidentielle-2022 --delta  # fichier corrigé
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from db import SessionLocal, dispose_engines, get_engine
+from db.dialects import is_embedded
+from utils.commune_importer import CommuneImporter
+from utils.election_configs import ELECTIONS
+from utils.election_importer import ElectionImporter
+from utils.election_layout import load_election_file
+from utils.file_manifest import FileManifest
+
+
+def import_tour(importer, manifest, election_config, tour, force=False,
+                chunk_size=None, delta=False, delete_missing=False):
+    """
+    Importe un tour d'une élection ; ignoré si le fichier est inchangé.
+    delta=True : réapplique un fichier corrigé (même déjà enregistré au
+    manifeste), seuls les résultats nouveaux ou modifiés (et supprimés
+    si delete_missing) sont écrits.
+    Un fichier déjà importé dont le contenu a changé passe
+    automatiquement par l'import différentiel : l'import classique ne
+    fait que compléter les résultats existants.
+    Retourne True si le tour a été importé.
+    """
+    tour_config = election_config["tours"][tour]
+    file_path = tour_config["fichier"]
+
+    file_hash = manifest.file_hash(file_path)
+    if not (force or delta) and manifest.is_imported(file_path, file_hash):
+        print(f"⏭️  {file_path} inchangé, import ignoré")
+        return False
+
+    if not delta and manifest.is_modified(file_path, file_hash):
+        print(f"🔁 {file_path} modifié depuis le dernier import : import différentiel")
+        delta = True
+
+    # Fichiers infra-départementaux (commune, bureau, circonscription),
+    # reconnus à leur en-tête
+    niveau = CommuneImporter.detect_niveau(file_path)
+    if tour_config.get("niveau", niveau) != niveau:
+        raise ValueError(
+            f"{file_path} : niveau configuré '{tour_config['niveau']}', "
+            f"niveau détecté '{niveau or 'departement'}'"
+        )
+
+    election = importer.get_or_create_election(
+        election_date=tour_config["date"],
+        type_election=election_config["type_election"],
+        tour=tour
+    )
+
+    if niveau is not None:
+        nb_lignes = CommuneImporter(importer=importer).import_file(
+            file_path, election.id, chunk_size=chunk_size, resume=not force,
+            source_hash=file_hash, overwrite=delta
+        )
+        manifest.record(
+            file_path,
+            nb_lignes=nb_lignes,
+            election_id=election.id,
+            file_hash=file_hash
+        )
+        return True
+
+    edf = load_election_file(file_path, tour_config.get("drop_rows", ()))
+
+    if not edf.df_departement.empty:
+        importer.import_departements(edf.df_departement)
+
+    # Règle inter-tables : somme des voix <= votants, par département
+    df_stats, df_candidats = importer.check_voix_votants(
+        edf.df_stat_elections, edf.df_candidat_resultat, election.id
+    )
+
+    if not df_stats.empty:
+        importer.import_stats(
+            df_stats, election.id,
+            on_conflict="overwrite" if delta else "skip"
+        )
+
+    if delta:
+        diff = importer.import_candidats_resultats_delta(
+            df_candidats, election.id,
+            delete_missing=delete_missing
+        )
+        print(
+            f"🔁 {diff['inserted']} ajoutés, {diff['updated']} modifiés, "
+            f"{diff['deleted']} supprimés, {diff['unchanged']} inchangés"
+        )
+    elif not df_candidats.empty:
+        importer.import_candidats_resultats(
+            df_candidats,
+            election.id,
+            chunk_size=chunk_size,
+            resume=not force,
+            source_hash=file_hash
+        )
+
+    manifest.record(
+        file_path,
+        nb_lignes=len(edf.df),
+        election_id=election.id,
+        nb_resultats=len(edf.df_candidat_resultat),
+        file_hash=file_hash
+    )
+    return True
+
+
+# =====================================================
+# Exécution parallèle
+# =====================================================
+def init_worker():
+    # Le pool de connexions hérité du processus parent n'est pas réutilisable
+    dispose_engines(close=False)
+
+
+def run_tour(key, tour, force=False, chunk_size=None, delta=False,
+             delete_missing=False):
+    """
+    Lecture + import d'un tour dans un processus worker, avec sa propre
+    connexion. Les insertions concurrentes de départements et de
+    candidats sont arbitrées en base (ON CONFLICT, insertions triées),
+    pas par les caches en mémoire propres à chaque processus.
+    Retourne (tour importé, lignes mises en quarantaine par table).
+    """
+    session = SessionLocal("bulk")
+    try:
+        importer = ElectionImporter(session=session)
+        imported = import_tour(
+            importer, FileManifest(session), ELECTIONS[key], tour,
+            force=force, chunk_size=chunk_size,
+            delta=delta, delete_missing=delete_missing
+        )
+        return imported, importer.validator.quarantined
+    finally:
+        session.close()
+
+
+def print_quarantine(quarantined):
+    for cible, nb_lignes in sorted(quarantined.items()):
+        print(f"⚠️  {nb_lignes} ligne(s) mise(s) en quarantaine pour {cible}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Import des élections en base")
+    parser.add_argument(
+        "elections",
+        nargs="*",
+        metavar="ELECTION",
+        help=f"Élections à importer parmi {', '.join(ELECTIONS)} (toutes par défaut)"
+    )
+    parser.add_argument(
+        "--tours",
+        nargs="+",
+        type=int,
+        help="Tours à importer (tous par défaut)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Réimporte les fichiers même si leur contenu est inchangé"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Nombre de lignes source par commit"
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Réapplique un fichier corrigé : seuls les résultats modifiés sont écrits"
+    )
+    parser.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="Avec --delta, supprime les résultats absents du fichier"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Nombre de processus (un tour par processus, 1 = séquentiel)"
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.elections) - set(ELECTIONS)
+    if unknown:
+        parser.error(f"élection(s) inconnue(s) : {', '.join(sorted(unknown))}")
+    if args.delete_missing and not args.delta:
+        parser.error("--delete-missing n'a de sens qu'avec --delta")
+    args.elections = args.elections or list(ELECTIONS)
+    return args
+
+
+def main():
+    args = parse_args()
+
+    tasks = [
+        (key, tour)
+        for key in args.elections
+        for tour in ELECTIONS[key]["tours"]
+        if not args.tours or tour in args.tours
+    ]
+
+    if args.workers > 1 and is_embedded(get_engine("bulk")):
+        # Base fichier (SQLite, DuckDB) : un seul écrivain à la fois
+        print("ℹ️  Backend embarqué : import séquentiel (--workers ignoré)")
+        args.workers = 1
+
+    if args.workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=args.workers, initializer=init_worker
+        ) as pool:
+            futures = {
+                pool.submit(
+                    run_tour, key, tour, args.force, args.chunk_size,
+                    args.delta, args.delete_missing
+                ): (key, tour)
+                for key, tour in tasks
+            }
+            quarantined = Counter()
+            for future in as_completed(futures):
+                key, tour = futures[future]
+                imported, tour_quarantined = future.result()
+                quarantined.update(tour_quarantined)
+                if imported:
+                    print(f"✅ {key} – Tour {tour} importé")
+        print_quarantine(quarantined)
+    else:
+        # Une seule session (et un seul cache candidats) pour tous les imports
+        session = SessionLocal("bulk")
+        importer = ElectionImporter(session=session)
+        manifest = FileManifest(session)
+        try:
+            for key, tour in tasks:
+                print(f"\n🚀 Traitement {key} – Tour {tour}")
+                if import_tour(
+                    importer, manifest, ELECTIONS[key], tour,
+                    force=args.force, chunk_size=args.chunk_size,
+                    delta=args.delta, delete_missing=args.delete_missing
+                ):
+                    print(f"✅ {key} – Tour {tour} importé")
+            print_quarantine(importer.validator.quarantined)
+        finally:
+            session.close()
+
+    print("\n🎉 Import terminé")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# =====================================================
+# Import DB des populations départementales
+# =====================================================
+#
+# Usage :
+#   python import_population.py                    # tous les fichiers pop-AAAA
+#   python import_population.py data/populations/source/pop-2022.xlsx
+#   python import_population.py --workers 4 --ensemble
+
+import argparse
+
+from db import SessionLocal
+from utils.population_importer import PopulationImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import des populations")
+    parser.add_argument(
+        "fichiers",
+        nargs="*",
+        help="Fichiers annuels (tous ceux de data/populations/source par défaut)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Nombre de processus de lecture (1 = séquentiel)"
+    )
+    parser.add_argument(
+        "--ensemble",
+        action="store_true",
+        help="Charge aussi le bloc « Ensemble » (sexe ENSEMBLE)"
+    )
+    args = parser.parse_args()
+    sexes = ("ENSEMBLE", "H", "F") if args.ensemble else ("H", "F")
+
+    session = SessionLocal("bulk")
+    try:
+        importer = PopulationImporter(session=session)
+        resultat = importer.import_files(
+            args.fichiers, workers=args.workers, sexes=sexes
+        )
+    finally:
+        session.close()
+
+    print(f"✅ {resultat['inserees']} populations insérées sur {resultat['lignes']}")
+    if resultat["departements_inconnus"]:
+        print(
+            "⚠️  Départements absents de la base : "
+            + ", ".join(resultat["departements_inconnus"])
+        )
+    for cible, nb_lignes in sorted(importer.validator.quarantined.items()):
+        print(f"⚠️  {nb_lignes} ligne(s) mise(s) en quarantaine pour {cible}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# =====================================================
+# Import DB des faits de sécurité (fichier SSMSI)
+# =====================================================
+#
+# Usage :
+#   python import_securite.py                       # fichier par défaut
+#   python import_securite.py chemin/securite.xlsx --chunk-size 2000
+#   python import_securite.py --force               # même si inchangé
+
+import argparse
+
+from db import SessionLocal
+from utils.file_manifest import FileManifest
+from utils.securite_importer import SECURITE_FILE, SecuriteImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import des faits de sécurité")
+    parser.add_argument("fichier", nargs="?", default=SECURITE_FILE)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Nombre de lignes source par commit"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Réimporte le fichier même si son contenu est inchangé"
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal("bulk")
+    try:
+        manifest = FileManifest(session)
+        file_hash = manifest.file_hash(args.fichier)
+        if not args.force and manifest.is_imported(args.fichier, file_hash):
+            print(f"⏭️  {args.fichier} inchangé, import ignoré")
+            return
+
+        importer = SecuriteImporter(session=session)
+        resultat = importer.import_file(
+            args.fichier, chunk_size=args.chunk_size
+        )
+        manifest.record(
+            args.fichier,
+            nb_lignes=resultat["lignes"],
+            nb_resultats=resultat["faits"],
+            file_hash=file_hash
+        )
+    finally:
+        session.close()
+
+    print(f"✅ {resultat['faits']} faits chargés ({resultat['lignes']} lignes lues)")
+    for cible, nb_lignes in sorted(importer.validator.quarantined.items()):
+        print(f"⚠️  {nb_lignes} ligne(s) mise(s) en quarantaine pour {cible}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,15 @@ import missingno as msno
 from statsmodels.stats.outliers_influence import variance_inflation_factor
 from statsmodels.tools.tools import add_constant
 
+from utils.excel_cache import read_excel_cached
+
 # %%
 def load_and_describe(file_path, n_rows=5):
 
     try:
         # Détection du type de fichier
         if file_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file_path)
+            df = read_excel_cached(file_path)
         elif file_path.endswith('.csv'):
             df = pd.read_csv(file_path)
         else:
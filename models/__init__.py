@@ -12,4 +12,17 @@ from .resultats_election import ResultatElection
 from .sexe import Sexe
 from .tranche_age import TrancheAge
 from .unite_de_compte import UniteDeCompte
-from .entreprise import Entreprise
\ No newline at end of file
+from .entreprise import Entreprise
+from .import_checkpoint import ImportCheckpoint
+from .import_manifest import ImportManifest
+from .resultat_commune import ResultatCommune
+from .resultat_bureau import ResultatBureau
+from .election_stats_commune import ElectionStatsCommune
+from .election_stats_bureau import ElectionStatsBureau
+from .circonscription import Circonscription
+from .nuance import Nuance, CandidatNuance
+from .resultat_circonscription import ResultatCirconscription
+from .election_stats_circonscription import ElectionStatsCirconscription
+from .remontee_departement import RemonteeDepartement, ElectionVersion
+
+from .import_quarantaine import ImportQuarantaine
@@ -0,0 +1,50 @@
+from sqlalchemy import (
+    Column,
+    String,
+    ForeignKey,
+    Index,
+)
+from db import Base
+
+
+class Circonscription(Base):
+    __tablename__ = "circonscriptions"
+
+    # =====================================================
+    # IDENTITÉ (clé primaire composée)
+    # =====================================================
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Code du département"
+    )
+
+    code_circonscription = Column(
+        String(2),
+        primary_key=True,
+        comment="Numéro de la circonscription dans le département (ex: 01)"
+    )
+
+    libelle = Column(
+        String(100),
+        nullable=True,
+        comment="Libellé officiel (ex: 1ère circonscription)"
+    )
+
+    # =====================================================
+    # INDEX
+    # =====================================================
+    __table_args__ = (
+        Index("ix_circonscriptions_dept", "code_dept"),
+    )
+
+    # =====================================================
+    # REPRÉSENTATION
+    # =====================================================
+    def __repr__(self) -> str:
+        return (
+            f"<Circonscription("
+            f"code_dept='{self.code_dept}', "
+            f"code_circonscription='{self.code_circonscription}')>"
+        )
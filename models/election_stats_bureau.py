@@ -0,0 +1,68 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ElectionStatsBureau(Base):
+    __tablename__ = "election_stats_bureau"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_commune = Column(
+        String(3),
+        nullable=False,
+        comment="Code de la commune dans le département (ex: 001)"
+    )
+    code_bureau = Column(
+        String(10),
+        nullable=False,
+        comment="Code du bureau de vote dans la commune (ex: 0001)"
+    )
+
+    nom_commune = Column(String(100), nullable=True)
+
+    nb_inscrits = Column(Integer, nullable=False)
+    nb_abstentions = Column(Integer, nullable=False)
+    nb_votants = Column(Integer, nullable=False)
+    nb_blancs_nuls = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "code_dept",
+            "code_commune",
+            "code_bureau",
+            name="uq_election_stats_bureau"
+        ),
+        CheckConstraint("nb_inscrits >= 0", name="ck_election_stats_bureau_inscrits_pos"),
+        CheckConstraint("nb_votants >= 0", name="ck_election_stats_bureau_votants_pos"),
+        CheckConstraint("nb_abstentions >= 0", name="ck_election_stats_bureau_abstentions_pos"),
+        CheckConstraint("nb_blancs_nuls >= 0", name="ck_election_stats_bureau_blancs_pos"),
+        CheckConstraint(
+            "nb_votants <= nb_inscrits",
+            name="ck_election_stats_bureau_votants_le_inscrits"
+        ),
+        Index("ix_election_stats_bureau_election_dept", "election_id", "code_dept"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ElectionStatsBureau("
+            f"election={self.election_id}, "
+            f"commune={self.code_dept}{self.code_commune}, "
+            f"bureau={self.code_bureau}, "
+            f"inscrits={self.nb_inscrits}, "
+            f"votants={self.nb_votants})>"
+        )
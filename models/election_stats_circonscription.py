@@ -0,0 +1,64 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey, ForeignKeyConstraint,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ElectionStatsCirconscription(Base):
+    __tablename__ = "election_stats_circonscription"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_circonscription = Column(
+        String(2),
+        nullable=False,
+        comment="Numéro de la circonscription dans le département (ex: 01)"
+    )
+
+    nb_inscrits = Column(Integer, nullable=False)
+    nb_abstentions = Column(Integer, nullable=False)
+    nb_votants = Column(Integer, nullable=False)
+    nb_blancs_nuls = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["code_dept", "code_circonscription"],
+            ["circonscriptions.code_dept", "circonscriptions.code_circonscription"],
+            ondelete="CASCADE"
+        ),
+        UniqueConstraint(
+            "election_id",
+            "code_dept",
+            "code_circonscription",
+            name="uq_election_stats_circonscription"
+        ),
+        CheckConstraint("nb_inscrits >= 0", name="ck_election_stats_circonscription_inscrits_pos"),
+        CheckConstraint("nb_votants >= 0", name="ck_election_stats_circonscription_votants_pos"),
+        CheckConstraint("nb_abstentions >= 0", name="ck_election_stats_circonscription_abstentions_pos"),
+        CheckConstraint("nb_blancs_nuls >= 0", name="ck_election_stats_circonscription_blancs_pos"),
+        CheckConstraint(
+            "nb_votants <= nb_inscrits",
+            name="ck_election_stats_circonscription_votants_le_inscrits"
+        ),
+        Index("ix_election_stats_circonscription_election_dept", "election_id", "code_dept"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ElectionStatsCirconscription("
+            f"election={self.election_id}, "
+            f"circonscription={self.code_dept}-{self.code_circonscription}, "
+            f"inscrits={self.nb_inscrits}, "
+            f"votants={self.nb_votants})>"
+        )
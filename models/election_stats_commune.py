@@ -0,0 +1,61 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ElectionStatsCommune(Base):
+    __tablename__ = "election_stats_commune"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_commune = Column(
+        String(3),
+        nullable=False,
+        comment="Code de la commune dans le département (ex: 001)"
+    )
+
+    nom_commune = Column(String(100), nullable=True)
+
+    nb_inscrits = Column(Integer, nullable=False)
+    nb_abstentions = Column(Integer, nullable=False)
+    nb_votants = Column(Integer, nullable=False)
+    nb_blancs_nuls = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "code_dept",
+            "code_commune",
+            name="uq_election_stats_commune"
+        ),
+        CheckConstraint("nb_inscrits >= 0", name="ck_election_stats_commune_inscrits_pos"),
+        CheckConstraint("nb_votants >= 0", name="ck_election_stats_commune_votants_pos"),
+        CheckConstraint("nb_abstentions >= 0", name="ck_election_stats_commune_abstentions_pos"),
+        CheckConstraint("nb_blancs_nuls >= 0", name="ck_election_stats_commune_blancs_pos"),
+        CheckConstraint(
+            "nb_votants <= nb_inscrits",
+            name="ck_election_stats_commune_votants_le_inscrits"
+        ),
+        Index("ix_election_stats_commune_election_dept", "election_id", "code_dept"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ElectionStatsCommune("
+            f"election={self.election_id}, "
+            f"commune={self.code_dept}{self.code_commune}, "
+            f"inscrits={self.nb_inscrits}, "
+            f"votants={self.nb_votants})>"
+        )
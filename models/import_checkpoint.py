@@ -0,0 +1,107 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+    CheckConstraint,
+    func,
+)
+from db import Base
+
+
+class ImportCheckpoint(Base):
+    __tablename__ = "import_checkpoint"
+
+    # =====================================================
+    # IDENTIFIANT
+    # =====================================================
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="Identifiant technique du point de reprise"
+    )
+
+    # =====================================================
+    # IMPORT CONCERNÉ
+    # =====================================================
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Élection en cours d'import"
+    )
+
+    cible = Column(
+        String(50),
+        nullable=False,
+        comment="Table alimentée par l'import (ex: resultats_election)"
+    )
+
+    hash_source = Column(
+        String(64),
+        nullable=True,
+        comment="Empreinte SHA-256 de la source importée (reprise seulement si identique)"
+    )
+
+    # =====================================================
+    # AVANCEMENT
+    # =====================================================
+    derniere_ligne = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Position (exclue) de la dernière ligne source traitée et committée"
+    )
+
+    nb_lignes = Column(
+        Integer,
+        nullable=True,
+        comment="Nombre total de lignes de la source (NULL si inconnu, import en flux)"
+    )
+
+    termine = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Vrai lorsque toutes les lignes ont été importées"
+    )
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        comment="Date du dernier commit de l'import"
+    )
+
+    # =====================================================
+    # CONTRAINTES
+    # =====================================================
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "cible",
+            name="uq_import_checkpoint_election_cible"
+        ),
+        CheckConstraint(
+            "derniere_ligne >= 0",
+            name="ck_import_checkpoint_ligne_positive"
+        ),
+    )
+
+    # =====================================================
+    # REPRÉSENTATION
+    # =====================================================
+    def __repr__(self) -> str:
+        return (
+            f"<ImportCheckpoint("
+            f"election_id={self.election_id}, "
+            f"cible='{self.cible}', "
+            f"derniere_ligne={self.derniere_ligne}, "
+            f"nb_lignes={self.nb_lignes}, "
+            f"termine={self.termine}"
+            f")>"
+        )
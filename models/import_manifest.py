@@ -0,0 +1,97 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Index,
+    CheckConstraint,
+    func,
+)
+from db import Base
+
+
+class ImportManifest(Base):
+    __tablename__ = "import_manifest"
+
+    # =====================================================
+    # IDENTIFIANT
+    # =====================================================
+    id = Column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="Identifiant technique de l'entrée du manifeste"
+    )
+
+    # =====================================================
+    # FICHIER SOURCE
+    # =====================================================
+    chemin = Column(
+        String(500),
+        nullable=False,
+        unique=True,
+        comment="Chemin du fichier source (ex: data/elections/presidentielles-2022-1.xlsx)"
+    )
+
+    hash_contenu = Column(
+        String(64),
+        nullable=False,
+        comment="Empreinte SHA-256 du contenu du fichier"
+    )
+
+    nb_lignes = Column(
+        Integer,
+        nullable=False,
+        comment="Nombre de lignes lues dans le fichier source"
+    )
+
+    nb_resultats = Column(
+        Integer,
+        nullable=True,
+        comment="Nombre de lignes résultats produites (format long)"
+    )
+
+    # =====================================================
+    # IMPORT
+    # =====================================================
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=True,
+        comment="Élection alimentée par le fichier"
+    )
+
+    imported_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        comment="Date de fin du dernier import complet"
+    )
+
+    # =====================================================
+    # CONTRAINTES & INDEX
+    # =====================================================
+    __table_args__ = (
+        CheckConstraint(
+            "nb_lignes >= 0",
+            name="ck_import_manifest_lignes_positive"
+        ),
+        Index(
+            "ix_import_manifest_hash",
+            "hash_contenu"
+        ),
+    )
+
+    # =====================================================
+    # REPRÉSENTATION
+    # =====================================================
+    def __repr__(self) -> str:
+        return (
+            f"<ImportManifest("
+            f"chemin='{self.chemin}', "
+            f"hash={self.hash_contenu[:12]}, "
+            f"election_id={self.election_id}, "
+            f"nb_lignes={self.nb_lignes}"
+            f")>"
+        )
@@ -0,0 +1,68 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    JSON,
+    ForeignKey,
+    Index,
+    func,
+)
+from db import Base
+
+
+class ImportQuarantaine(Base):
+    __tablename__ = "import_quarantaine"
+
+    # =====================================================
+    # IDENTIFIANT
+    # =====================================================
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # =====================================================
+    # LIGNE REJETÉE
+    # =====================================================
+    cible = Column(
+        String(100),
+        nullable=False,
+        comment="Table à laquelle la ligne était destinée"
+    )
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=True,
+        comment="Élection concernée, le cas échéant"
+    )
+
+    regles = Column(
+        String(500),
+        nullable=False,
+        comment="Règles violées (noms des contraintes), séparées par des virgules"
+    )
+
+    donnees = Column(
+        JSON,
+        nullable=False,
+        comment="Contenu de la ligne préparée"
+    )
+
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now()
+    )
+
+    # =====================================================
+    # INDEX
+    # =====================================================
+    __table_args__ = (
+        Index("ix_import_quarantaine_cible", "cible"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ImportQuarantaine("
+            f"cible='{self.cible}', "
+            f"regles='{self.regles}')>"
+        )
@@ -0,0 +1,106 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+)
+from db import Base
+
+
+class Nuance(Base):
+    __tablename__ = "nuances"
+
+    # =====================================================
+    # IDENTITÉ
+    # =====================================================
+    code = Column(
+        String(10),
+        primary_key=True,
+        comment="Code de nuance politique (ex: ENS, RN, NUP, LR)"
+    )
+
+    libelle = Column(
+        String(100),
+        nullable=True,
+        comment="Libellé de la nuance"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Nuance(code='{self.code}')>"
+
+
+class CandidatNuance(Base):
+    __tablename__ = "candidat_nuance"
+
+    # =====================================================
+    # IDENTIFIANT
+    # =====================================================
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # =====================================================
+    # RELATIONS
+    # =====================================================
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    candidat_id = Column(
+        Integer,
+        ForeignKey("candidats.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # =====================================================
+    # CIRCONSCRIPTION ÉLECTORALE
+    # =====================================================
+    # Les candidats sont identifiés par (nom, prénom, sexe) : deux
+    # homonymes de circonscriptions différentes partagent le même
+    # candidat_id, mais chacun garde sa nuance.
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False,
+        comment="Département de la candidature"
+    )
+
+    code_circonscription = Column(
+        String(3),
+        nullable=False,
+        comment="Circonscription de la candidature (circonscription législative, "
+                "ou code commune pour les municipales)"
+    )
+
+    nuance_code = Column(
+        String(10),
+        ForeignKey("nuances.code", ondelete="RESTRICT"),
+        nullable=False,
+        comment="Nuance attribuée au candidat pour cette élection"
+    )
+
+    # =====================================================
+    # CONTRAINTES & INDEX
+    # =====================================================
+    __table_args__ = (
+        # Une nuance par candidature (candidat, élection, circonscription)
+        UniqueConstraint(
+            "election_id",
+            "candidat_id",
+            "code_dept",
+            "code_circonscription",
+            name="uq_candidat_nuance_election"
+        ),
+        Index("ix_candidat_nuance_nuance", "nuance_code"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CandidatNuance("
+            f"election_id={self.election_id}, "
+            f"candidat_id={self.candidat_id}, "
+            f"circonscription='{self.code_dept}-{self.code_circonscription}', "
+            f"nuance='{self.nuance_code}')>"
+        )
@@ -0,0 +1,120 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    BigInteger,
+    String,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+    func,
+)
+from db import Base
+
+
+class RemonteeDepartement(Base):
+    __tablename__ = "remontee_departement"
+
+    # =====================================================
+    # IDENTIFIANT
+    # =====================================================
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # =====================================================
+    # RELATIONS
+    # =====================================================
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # =====================================================
+    # ÉTAT DE REMONTÉE (soir d'élection)
+    # =====================================================
+    etat_saisie = Column(
+        String(20),
+        nullable=False,
+        comment="État de saisie publié (ex: Complet, Partiel)"
+    )
+
+    empreinte = Column(
+        BigInteger,
+        nullable=False,
+        comment="Empreinte de la ligne source, pour détecter les changements"
+    )
+
+    version = Column(
+        Integer,
+        nullable=False,
+        comment="Version de l'élection à laquelle le département a changé"
+    )
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        comment="Date de la dernière mise à jour du département"
+    )
+
+    # =====================================================
+    # CONTRAINTES & INDEX
+    # =====================================================
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "code_dept",
+            name="uq_remontee_election_dept"
+        ),
+        Index("ix_remontee_election_version", "election_id", "version"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RemonteeDepartement("
+            f"election_id={self.election_id}, "
+            f"code_dept='{self.code_dept}', "
+            f"etat='{self.etat_saisie}', "
+            f"version={self.version})>"
+        )
+
+
+class ElectionVersion(Base):
+    __tablename__ = "election_version"
+
+    # =====================================================
+    # COMPTEUR DE VERSION
+    # =====================================================
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Incrémenté à chaque rafraîchissement modifiant des données "
+                "(clé de cache pour les consommateurs)"
+    )
+
+    updated_at = Column(
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        comment="Date du dernier rafraîchissement"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ElectionVersion("
+            f"election_id={self.election_id}, "
+            f"version={self.version})>"
+        )
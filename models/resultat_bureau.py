@@ -0,0 +1,68 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ResultatBureau(Base):
+    __tablename__ = "resultats_bureau"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    candidat_id = Column(
+        Integer,
+        ForeignKey("candidats.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_commune = Column(
+        String(3),
+        nullable=False,
+        comment="Code de la commune dans le département (ex: 001)"
+    )
+    code_bureau = Column(
+        String(10),
+        nullable=False,
+        comment="Code du bureau de vote dans la commune (ex: 0001)"
+    )
+
+    nb_voix = Column(Integer, nullable=False)
+
+    # Les totaux départementaux se déduisent par agrégation
+    # (voir CommuneImporter.resultats_departement)
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "candidat_id",
+            "code_dept",
+            "code_commune",
+            "code_bureau",
+            name="uq_resultats_bureau"
+        ),
+        CheckConstraint(
+            "nb_voix >= 0",
+            name="ck_resultats_bureau_nb_voix_positive"
+        ),
+        Index("ix_resultats_bureau_election_dept", "election_id", "code_dept"),
+        Index("ix_resultats_bureau_candidat", "candidat_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ResultatBureau("
+            f"election_id={self.election_id}, "
+            f"candidat_id={self.candidat_id}, "
+            f"commune={self.code_dept}{self.code_commune}, "
+            f"bureau={self.code_bureau}, "
+            f"nb_voix={self.nb_voix})>"
+        )
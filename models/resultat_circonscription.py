@@ -0,0 +1,66 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey, ForeignKeyConstraint,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ResultatCirconscription(Base):
+    __tablename__ = "resultats_circonscription"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    candidat_id = Column(
+        Integer,
+        ForeignKey("candidats.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_circonscription = Column(
+        String(2),
+        nullable=False,
+        comment="Numéro de la circonscription dans le département (ex: 01)"
+    )
+
+    nb_voix = Column(Integer, nullable=False)
+
+    # Les totaux départementaux se déduisent par agrégation
+    # (voir CommuneImporter.resultats_departement)
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["code_dept", "code_circonscription"],
+            ["circonscriptions.code_dept", "circonscriptions.code_circonscription"],
+            ondelete="CASCADE"
+        ),
+        UniqueConstraint(
+            "election_id",
+            "candidat_id",
+            "code_dept",
+            "code_circonscription",
+            name="uq_resultats_circonscription"
+        ),
+        CheckConstraint(
+            "nb_voix >= 0",
+            name="ck_resultats_circonscription_nb_voix_positive"
+        ),
+        Index("ix_resultats_circonscription_election_dept", "election_id", "code_dept"),
+        Index("ix_resultats_circonscription_candidat", "candidat_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ResultatCirconscription("
+            f"election_id={self.election_id}, "
+            f"candidat_id={self.candidat_id}, "
+            f"circonscription={self.code_dept}-{self.code_circonscription}, "
+            f"nb_voix={self.nb_voix})>"
+        )
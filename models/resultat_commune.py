@@ -0,0 +1,61 @@
+from sqlalchemy import (
+    Column, Integer, ForeignKey,
+    UniqueConstraint, CheckConstraint, Index, String
+)
+from db import Base
+
+
+class ResultatCommune(Base):
+    __tablename__ = "resultats_commune"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    election_id = Column(
+        Integer,
+        ForeignKey("elections.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    candidat_id = Column(
+        Integer,
+        ForeignKey("candidats.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_dept = Column(
+        String(2),
+        ForeignKey("departements.code_dept", ondelete="CASCADE"),
+        nullable=False
+    )
+    code_commune = Column(
+        String(3),
+        nullable=False,
+        comment="Code de la commune dans le département (ex: 001)"
+    )
+
+    nb_voix = Column(Integer, nullable=False)
+
+    # Les totaux départementaux se déduisent par agrégation
+    # (voir CommuneImporter.resultats_departement)
+    __table_args__ = (
+        UniqueConstraint(
+            "election_id",
+            "candidat_id",
+            "code_dept",
+            "code_commune",
+            name="uq_resultats_commune"
+        ),
+        CheckConstraint(
+            "nb_voix >= 0",
+            name="ck_resultats_commune_nb_voix_positive"
+        ),
+        Index("ix_resultats_commune_election_dept", "election_id", "code_dept"),
+        Index("ix_resultats_commune_candidat", "candidat_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ResultatCommune("
+            f"election_id={self.election_id}, "
+            f"candidat_id={self.candidat_id}, "
+            f"commune={self.code_dept}{self.code_commune}, "
+            f"nb_voix={self.nb_voix})>"
+        )
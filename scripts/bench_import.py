@@ -0,0 +1,55 @@
+# =====================================================
+# Benchmark import résultats : ORM vs chargement en masse (lignes/s)
+# =====================================================
+#
+# Usage : python -m scripts.bench_import [fichier.xlsx]
+#
+# Chaque chemin est exécuté dans une transaction annulée à la fin :
+# la base n'est pas modifiée.
+
+import sys
+import time
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from db import get_engine
+from enums.type_election import TypeElection
+from utils.election_dataframe import ElectionDataFrame
+from utils.election_importer import ElectionImporter
+
+engine = get_engine("bulk")
+FILE_PATH = sys.argv[1] if len(sys.argv) > 1 else "./data/elections/presidentielles-2022-1.xlsx"
+
+
+def run(edf, bulk):
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            importer = ElectionImporter(session=session)
+            election = importer.get_or_create_election(
+                election_date=date(1900, 1, 1),
+                type_election=TypeElection.AUTRE,
+                tour=1
+            )
+            importer.import_departements(edf.df_departement)
+
+            start = time.perf_counter()
+            importer.import_candidats_resultats(
+                edf.df_candidat_resultat, election.id, bulk=bulk
+            )
+            return time.perf_counter() - start
+        finally:
+            session.close()
+            transaction.rollback()
+
+
+if __name__ == "__main__":
+    edf = ElectionDataFrame(FILE_PATH)
+    n_rows = len(edf.df_candidat_resultat)
+
+    print(f"📄 {FILE_PATH} : {n_rows} lignes résultats")
+    for label, bulk in (("ORM", False), ("BULK", True)):
+        elapsed = run(edf, bulk)
+        print(f"{label:>5} : {elapsed:8.3f} s  {n_rows / elapsed:12.0f} lignes/s")
@@ -0,0 +1,61 @@
+# =====================================================
+# Mémoire de l'import multi-élections (tracemalloc)
+# =====================================================
+#
+# Usage : python -m scripts.bench_memory [nb_elections]
+#
+# Importe le même fichier de résultats comme N élections distinctes
+# avec un seul ElectionImporter, dans une base SQLite en mémoire,
+# et mesure le pic mémoire de chaque import. Les caches ne gardant
+# que des clés et les objets étant détachés après flush, le pic doit
+# rester stable d'une élection à l'autre.
+
+import sys
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from db import Base
+from enums.type_election import TypeElection
+from utils.election_dataframe import ElectionDataFrame
+from utils.election_importer import ElectionImporter
+
+FILE_PATH = "./data/elections/presidentielles-2022-1.xlsx"
+N_ELECTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+TOLERANCE = 1.2  # écart toléré entre le premier et le dernier pic
+
+
+if __name__ == "__main__":
+    edf = ElectionDataFrame(FILE_PATH)
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    peaks = []
+    with Session(engine) as session:
+        importer = ElectionImporter(session=session)
+        importer.import_departements(edf.df_departement)
+
+        tracemalloc.start()
+        for i in range(N_ELECTIONS):
+            election = importer.get_or_create_election(
+                date(1900, 1, 1) + timedelta(days=i), TypeElection.AUTRE
+            )
+            tracemalloc.reset_peak()
+            importer.import_candidats_resultats(
+                edf.df_candidat_resultat, election.id, bulk=False
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak)
+            print(
+                f"Élection {i + 1:3d} : pic {peak / 1024:9.1f} Kio  "
+                f"identity map {len(session.identity_map)} objets"
+            )
+        tracemalloc.stop()
+
+    assert peaks[-1] <= peaks[0] * TOLERANCE, (
+        f"Pic mémoire en hausse : {peaks[0]} -> {peaks[-1]} octets"
+    )
+    print("✅ Pic mémoire stable")
@@ -0,0 +1,110 @@
+# =====================================================
+# Benchmark préparation résultats : ligne à ligne vs vectorisé
+# =====================================================
+#
+# Usage : python -m scripts.bench_prepare
+#
+# Chaque fichier présidentiel est importé deux fois dans une base
+# SQLite en mémoire : via import_candidat_resultat_ligne (iterrows)
+# puis via prepare_resultats (préparation vectorisée, résolution des
+# candidats comprise) suivi d'un chargement en masse (bulk_resultats).
+# Côté vectorisé, préparation et écriture sont chronométrées à part ;
+# le ligne à ligne les mêle, son temps total est comparé à la
+# préparation vectorisée seule, puis au total vectorisé.
+# Les deux tables resultats_election produites doivent être identiques
+# (candidats comparés par nom, prénom et sexe).
+
+import time
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from db import Base
+from enums.type_election import TypeElection
+from models import Candidat, ResultatElection
+from utils.election_importer import ElectionImporter
+
+FILES = [
+    f"./data/elections/presidentielles-{annee}-{tour}.xlsx"
+    for annee in (2012, 2017, 2022)
+    for tour in (1, 2)
+]
+CANDIDATE_COLUMNS = ["Sexe", "Nom", "Prenom", "Voix", "% Voix/Ins", "% Voix/Exp"]
+
+
+def candidats_resultats(df):
+    """Format long attendu par ElectionImporter (6 colonnes par candidat)."""
+    n_general = list(df.columns).index("Sexe")
+    df_candidates = df.iloc[:, n_general:]
+    dfs = []
+    for start in range(0, df_candidates.shape[1] - 5, len(CANDIDATE_COLUMNS)):
+        df_cand = df_candidates.iloc[:, start:start + len(CANDIDATE_COLUMNS)].copy()
+        df_cand.columns = CANDIDATE_COLUMNS
+        dfs.append(pd.concat([df.iloc[:, :2], df_cand], axis=1))
+    return pd.concat(dfs, ignore_index=True).dropna(subset=["Nom", "Voix"])
+
+
+def run(df_candidat_resultat, vectorise):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        importer = ElectionImporter(session=session)
+        election = importer.get_or_create_election(
+            date(1900, 1, 1), TypeElection.AUTRE
+        )
+        # Départements référencés par les résultats (sinon quarantaine)
+        importer.import_departements(
+            df_candidat_resultat.iloc[:, :2].set_axis(["code_dept", "nom_dept"], axis=1)
+        )
+
+        importer.existing_candidates = importer.preload_candidates()
+        importer.existing_results = importer.preload_results(election.id)
+
+        start = time.perf_counter()
+        if vectorise:
+            df_resultats = importer.prepare_resultats(df_candidat_resultat, election.id)
+            prepared = time.perf_counter()
+            importer.bulk_resultats(df_resultats)
+        else:
+            for _, row in df_candidat_resultat.iterrows():
+                importer.import_candidat_resultat_ligne(row, election.id)
+            prepared = None
+        session.commit()
+        end = time.perf_counter()
+        # (préparation, écriture) ; ligne à ligne, les deux sont mêlées
+        timings = (prepared - start, end - prepared) if prepared else (end - start, None)
+
+        # Comparaison par identité du candidat : les ids dépendent de
+        # l'ordre d'insertion des candidats (trié côté vectorisé)
+        rows = session.execute(
+            select(
+                Candidat.nom,
+                Candidat.prenom,
+                Candidat.sexe,
+                ResultatElection.code_dept,
+                ResultatElection.nb_voix,
+            ).join(Candidat, ResultatElection.candidat_id == Candidat.id)
+            .order_by(
+                Candidat.nom, Candidat.prenom, Candidat.sexe,
+                ResultatElection.code_dept
+            )
+        ).all()
+    return timings, rows
+
+
+if __name__ == "__main__":
+    for file_path in FILES:
+        df_candidat_resultat = candidats_resultats(pd.read_excel(file_path))
+        (t_ligne, _), rows_ligne = run(df_candidat_resultat, vectorise=False)
+        (t_prep, t_write), rows_vect = run(df_candidat_resultat, vectorise=True)
+
+        assert rows_ligne == rows_vect, f"Résultats différents pour {file_path}"
+        print(
+            f"{file_path} : {len(rows_vect):6d} lignes  "
+            f"ligne {t_ligne:7.3f} s  "
+            f"préparation {t_prep:7.3f} s (x{t_ligne / t_prep:.1f})  "
+            f"écriture {t_write:7.3f} s  "
+            f"total x{t_ligne / (t_prep + t_write):.1f}"
+        )
@@ -0,0 +1,94 @@
+# =====================================================
+# Benchmark passage large -> long des blocs candidats
+# =====================================================
+#
+# Usage : python -m scripts.bench_reshape
+#
+# Compare ElectionDataFrame._prepare_candidats (version vectorisée,
+# utils/election_dataframe.py et utils/election_dataframe2.py) à
+# l'ancienne boucle iloc + concat, sur des feuilles synthétiques de
+# taille croissante (nombre de candidats x nombre de lignes).
+# Les DataFrames produits doivent être identiques.
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import election_dataframe, election_dataframe2
+
+N_GENERAL_COLS = 17
+COLS_GLOBALES = ["Code du département", "Libellé du département"]
+CANDIDATE_COLS = ["Sexe", "Nom", "Prenom", "Voix", "% Voix/Ins", "% Voix/Exp"]
+SIZES = [(12, 107), (12, 35_000), (100, 577), (500, 577), (2_000, 577)]
+
+
+def synthetic_sheet(n_candidates, n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = [str(i) if i % 50 else "2A" for i in range(1, n_rows + 1)]
+    columns = {
+        COLS_GLOBALES[0]: pd.Series(codes, dtype=object),
+        COLS_GLOBALES[1]: [f"Territoire {i}" for i in range(n_rows)],
+    }
+    for k in range(2, N_GENERAL_COLS):
+        columns[f"general_{k}"] = rng.integers(0, 10_000, n_rows)
+    for c in range(n_candidates):
+        columns[f"Sexe.{c}"] = rng.choice(["M", "F"], n_rows)
+        columns[f"Nom.{c}"] = [f"NOM{c}"] * n_rows
+        columns[f"Prenom.{c}"] = [f"Prenom{c}"] * n_rows
+        columns[f"Voix.{c}"] = rng.integers(0, 100_000, n_rows)
+        columns[f"Ins.{c}"] = rng.random(n_rows)
+        columns[f"Exp.{c}"] = rng.random(n_rows)
+    return pd.DataFrame(columns)
+
+
+def ancienne_boucle(df, normalize_code=None):
+    """Implémentation d'origine (boucle iloc + concat), pour référence."""
+    df_candidates = df.iloc[:, N_GENERAL_COLS:]
+    num_candidates = df_candidates.shape[1] // len(CANDIDATE_COLS)
+    dfs = []
+    for i in range(num_candidates):
+        start = i * len(CANDIDATE_COLS)
+        df_cand = df_candidates.iloc[:, start:start + len(CANDIDATE_COLS)].copy()
+        df_cand.columns = CANDIDATE_COLS
+        df_cand = pd.concat([df[COLS_GLOBALES].copy(), df_cand], axis=1)
+        if normalize_code:
+            df_cand[COLS_GLOBALES[0]] = df_cand[COLS_GLOBALES[0]].map(normalize_code)
+        dfs.append(df_cand)
+    return pd.concat(dfs, ignore_index=True)[COLS_GLOBALES + CANDIDATE_COLS[:4]]
+
+
+def vectorise(module, df):
+    edf = object.__new__(module.ElectionDataFrame)
+    edf.df = df
+    # Feuilles synthétiques sans colonne « Etat saisie » : aucun filtre
+    edf.config = {"keep_partial": True}
+    edf._prepare_candidats()
+    return edf.df_candidat_resultat
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    normalize_code = election_dataframe2.ElectionDataFrame.normalize_code
+
+    for n_candidates, n_rows in SIZES:
+        df = synthetic_sheet(n_candidates, n_rows)
+
+        t_old, expected = timed(ancienne_boucle, df)
+        t_v1, result_v1 = timed(vectorise, election_dataframe, df)
+        pd.testing.assert_frame_equal(result_v1, expected)
+
+        t_old2, expected2 = timed(ancienne_boucle, df, normalize_code)
+        t_v2, result_v2 = timed(vectorise, election_dataframe2, df)
+        pd.testing.assert_frame_equal(result_v2, expected2)
+
+        print(
+            f"{n_candidates:5d} candidats x {n_rows:6d} lignes : "
+            f"boucle {t_old:7.3f} s / vectorisé {t_v1:7.3f} s (x{t_old / t_v1:5.1f})  |  "
+            f"v2 boucle {t_old2:7.3f} s / vectorisé {t_v2:7.3f} s (x{t_old2 / t_v2:5.1f})"
+        )
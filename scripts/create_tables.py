@@ -1,9 +1,10 @@
-from db import engine
-from db import Base
+from db import Base, get_engine
 
 # Importer les modèles pour les enregistrer
 import models
 
+engine = get_engine("bulk")
+
 # Supprime toutes les tables (pour environnement de test)
 Base.metadata.drop_all(bind=engine)
 
@@ -0,0 +1,70 @@
+# =====================================================
+# Cache Parquet des fichiers Excel de data/
+# =====================================================
+#
+# Usage :
+#   python -m scripts.excel_cache warm   # convertit toutes les feuilles
+#   python -m scripts.excel_cache prune  # supprime les entrées obsolètes
+#   python -m scripts.excel_cache bench  # lecture à froid vs à chaud
+
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from utils.excel_cache import prune_cache, read_excel_cached
+
+DATA_DIR = "./data"
+
+
+def excel_files(data_dir=DATA_DIR):
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(data_dir)
+        for name in names
+        if name.endswith((".xlsx", ".xls"))
+    )
+
+
+def warm():
+    for path in excel_files():
+        for sheet_name in pd.ExcelFile(path).sheet_names:
+            read_excel_cached(path, sheet_name=sheet_name)
+        print(f"🔥 {path}")
+
+
+def prune():
+    removed = prune_cache(DATA_DIR)
+    for name in removed:
+        print(f"🗑️  {name}")
+    print(f"✅ {len(removed)} fichier(s) de cache supprimé(s)")
+
+
+def bench():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for path in excel_files():
+            start = time.perf_counter()
+            pd.read_excel(path)
+            t_excel = time.perf_counter() - start
+
+            read_excel_cached(path, cache_dir=cache_dir)  # conversion initiale
+
+            start = time.perf_counter()
+            read_excel_cached(path, cache_dir=cache_dir)
+            t_cache = time.perf_counter() - start
+
+            print(
+                f"{path:70s} froid {t_excel * 1000:8.1f} ms  "
+                f"chaud {t_cache * 1000:7.1f} ms  (x{t_excel / t_cache:.0f})"
+            )
+
+
+COMMANDS = {"warm": warm, "prune": prune, "bench": bench}
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "bench"
+    if command not in COMMANDS:
+        sys.exit(f"Commande inconnue : {command} ({', '.join(COMMANDS)})")
+    COMMANDS[command]()
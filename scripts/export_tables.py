@@ -1,21 +1,25 @@
 import os
-import pandas as pd
-from sqlalchemy import inspect
+from sqlalchemy import MetaData
 from db.session import SessionLocal
+from db.stream import read_table
 
 EXPORT_DIR = "exports"
 os.makedirs(EXPORT_DIR, exist_ok=True)
 
-engine = SessionLocal().bind
-inspector = inspect(engine)
+# Lecture seule, curseurs serveur : chaque table est lue et écrite par paquets
+session = SessionLocal("analytics")
+metadata = MetaData()
+metadata.reflect(bind=session.connection())
 
-tables = inspector.get_table_names()
+tables = sorted(metadata.tables)
 
 print(f"📦 Tables trouvées : {tables}")
 
 for table in tables:
     print(f"➡️ Export de {table}...")
-    df = pd.read_sql_table(table, con=engine)
-    df.to_csv(f"{EXPORT_DIR}/{table}.csv", index=False)
+    path = f"{EXPORT_DIR}/{table}.csv"
+    for i, df in enumerate(read_table(session, metadata.tables[table])):
+        df.to_csv(path, index=False, header=i == 0, mode="w" if i == 0 else "a")
 
-print("✅ Export CSV complet terminé")
\ No newline at end of file
+session.close()
+print("✅ Export CSV complet terminé")
@@ -0,0 +1,48 @@
+import pandas as pd
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from db.stream import read_frame, stream_frames
+
+metadata = MetaData()
+points = Table(
+    "points", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("label", String(10)),
+)
+
+
+def make_session():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    session = Session(engine)
+    session.execute(insert(points), [{"id": i, "label": f"p{i}"} for i in range(10)])
+    return session
+
+
+def test_read_frame_leaves_connection_options_unchanged():
+    session = make_session()
+    before = session.connection().get_execution_options()
+
+    df = read_frame(session, select(points), chunk_size=3)
+
+    assert len(df) == 10
+    assert session.connection().get_execution_options() == before
+
+
+def test_stream_frames_chunks():
+    session = make_session()
+
+    chunks = list(stream_frames(session, select(points).order_by(points.c.id), chunk_size=4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.concat(chunks, ignore_index=True)["id"].tolist() == list(range(10))
+
+
+def test_read_frame_empty_keeps_columns():
+    session = make_session()
+
+    df = read_frame(session, select(points).where(points.c.id < 0))
+
+    assert df.empty
+    assert list(df.columns) == ["id", "label"]
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+
+from db.bulk import execute_frame
+from db.session import SessionLocal
+from db.upsert import dialect_insert
+from models import Chomage, Departement
+from utils.excel_cache import read_excel_cached
+from utils.validation import PreInsertValidator
+
+CHOMAGE_FILE = "./data/economie/emploie/chomage.xlsx"
+PERIODE_PATTERN = r"^(\d{4})-T([1-4])$"
+
+
+class ChomageImporter:
+    """
+    Import des taux de chômage trimestriels par département
+    (fichier INSEE : une ligne par département, une colonne par
+    trimestre « AAAA-Tn »).
+
+    Le nom du département est résolu en code en pandas (une seule
+    requête sur departements) puis les lignes sont chargées par un
+    upsert sur (code_dept, annee, trimestre) : l'import peut être
+    relancé à chaque nouveau trimestre.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+        self.validator = PreInsertValidator(self.session)
+
+    # =====================================================
+    # Préparation vectorisée
+    # =====================================================
+    @staticmethod
+    def prepare(df, libelle_column="Libellé"):
+        """
+        Passe le tableau large en forme longue :
+        colonnes nom_dept, annee, trimestre, taux_chomage.
+        Les colonnes qui ne sont pas des trimestres sont ignorées,
+        les valeurs non numériques (« (O) ») deviennent NULL.
+        """
+        periodes = df.columns.to_series().astype(str).str.extract(PERIODE_PATTERN)
+        is_periode = periodes[0].notna().to_numpy()
+        periodes = periodes[is_periode].astype(int)
+
+        valeurs = df.loc[:, is_periode].apply(pd.to_numeric, errors="coerce")
+        n_dept, n_periodes = valeurs.shape
+
+        # Ordre ligne par ligne : un département, tous ses trimestres
+        return pd.DataFrame({
+            "nom_dept": np.repeat(
+                df[libelle_column].astype(str).str.strip().str.lower().to_numpy(),
+                n_periodes
+            ),
+            "annee": np.tile(periodes[0].to_numpy(), n_dept),
+            "trimestre": np.tile(periodes[1].to_numpy(), n_dept),
+            "taux_chomage": valeurs.to_numpy(dtype=float).ravel(),
+        })
+
+    # =====================================================
+    # Import
+    # =====================================================
+    def department_codes(self, noms):
+        """Correspondance nom -> code des départements connus, en une requête."""
+        return dict(
+            self.session.execute(
+                select(Departement.nom_dept, Departement.code_dept)
+                .where(Departement.nom_dept.in_(noms))
+            ).all()
+        )
+
+    def import_dataframe(self, df, libelle_column="Libellé"):
+        """
+        Upsert des taux en une instruction INSERT ... ON CONFLICT DO
+        UPDATE envoyée pour toutes les lignes (execute_frame).
+        Retourne {"lignes": n, "departements_inconnus": [...]}.
+        """
+        df_long = self.prepare(df, libelle_column)
+
+        noms = df_long["nom_dept"].unique().tolist()
+        codes = self.department_codes(noms)
+        inconnus = sorted(set(noms) - set(codes))
+
+        df_long = df_long[df_long["nom_dept"].isin(list(codes))]
+        df_long = self.validator.validate(
+            Chomage.__table__,
+            pd.DataFrame({
+                "code_dept": df_long["nom_dept"].map(codes),
+                "annee": df_long["annee"],
+                "trimestre": df_long["trimestre"],
+                "taux_chomage": df_long["taux_chomage"],
+            })
+        )
+
+        table = Chomage.__table__
+        stmt = dialect_insert(self.session, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["code_dept", "annee", "trimestre"],
+            set_={"taux_chomage": stmt.excluded.taux_chomage},
+            where=table.c.taux_chomage.is_distinct_from(stmt.excluded.taux_chomage)
+        )
+        execute_frame(self.session, stmt, df_long)
+        self.session.commit()
+
+        return {"lignes": len(df_long), "departements_inconnus": inconnus}
+
+    def import_file(self, path=CHOMAGE_FILE):
+        return self.import_dataframe(read_excel_cached(path))
@@ -0,0 +1,43 @@
+import csv
+from itertools import islice
+
+import pandas as pd
+
+
+# =====================================================
+# Lecture en flux d'un fichier source
+# =====================================================
+def iter_source_chunks(path, chunk_size, encoding="latin-1"):
+    """
+    Renvoie (en-tête, itérateur de DataFrames à colonnes positionnelles).
+    Seules les lignes d'un paquet sont en mémoire à un instant donné.
+    """
+    if path.endswith((".csv", ".txt")):
+        with open(path, encoding=encoding, newline="") as f:
+            header = next(csv.reader(f, delimiter=";"))
+            # Lignes de longueur variable (un bloc par candidat présent)
+            n_fields = max(line.count(";") for line in f) + 1
+        chunks = pd.read_csv(
+            path, sep=";", header=None, skiprows=1, dtype=str,
+            names=range(max(n_fields, len(header))),
+            encoding=encoding, chunksize=chunk_size
+        )
+        return header, chunks
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    rows = workbook.active.iter_rows(values_only=True)
+    header = [str(col) if col is not None else "" for col in next(rows)]
+
+    def chunks():
+        try:
+            while True:
+                batch = list(islice(rows, chunk_size))
+                if not batch:
+                    return
+                yield pd.DataFrame(batch)
+        finally:
+            workbook.close()
+
+    return header, chunks()
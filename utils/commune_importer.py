@@ -0,0 +1,387 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+
+from db.bulk import bulk_insert, execute_frame
+from db.upsert import dialect_insert
+from models import (
+    ResultatCommune, ResultatBureau, ResultatCirconscription,
+    ElectionStatsCommune, ElectionStatsBureau, ElectionStatsCirconscription,
+    Circonscription, Nuance, CandidatNuance,
+)
+from utils.chunked_reader import iter_source_chunks
+from utils.election_importer import ElectionImporter
+from utils.election_layout import GENERAL_COLUMN_NAMES, read_header
+from utils.file_manifest import FileManifest
+
+# Libellés des colonnes propres aux fichiers commune / bureau de vote
+FINE_COLUMN_NAMES = {
+    **GENERAL_COLUMN_NAMES,
+    "Code de la commune": "code_commune",
+    "Libellé de la commune": "nom_commune",
+    "Code du b.vote": "code_bureau",
+    "Code B.Vote": "code_bureau",
+    "Code de la circonscription": "code_circonscription",
+    "Libellé de la circonscription": "nom_circonscription",
+}
+
+# Colonnes d'un bloc candidat (ou liste) -> rôle ; les autres colonnes
+# connues du bloc (pourcentages, sièges...) sont ignorées
+BLOCK_ROLES = {
+    "Sexe": "Sexe",
+    "Nom": "Nom",
+    "Prénom": "Prenom",
+    "Voix": "Voix",
+    "Nuance": "Nuance",
+    "Code Nuance": "Nuance",
+}
+BLOCK_COLUMNS = set(BLOCK_ROLES) | {
+    "N°Panneau", "N°Liste", "Liste", "Libellé Abrégé Liste",
+    "Libellé Etendu Liste", "Nom Tête de Liste", "Sièges / Elu",
+    "Sièges Secteur", "Sièges CC", "Elu", "Sièges",
+    "% Voix/Ins", "% Voix/Exp",
+}
+BLOCK_FIRST_COLUMNS = ["N°Panneau", "N°Liste", "Code Nuance", "Sexe"]
+
+# Largeur des codes géographiques numériques
+CODE_WIDTHS = {"code_commune": 3, "code_bureau": 4, "code_circonscription": 2}
+
+# Tables cibles par niveau géographique ; "candidature" : colonnes de
+# la circonscription électorale (département, circonscription ou commune)
+NIVEAUX = {
+    "commune": {
+        "resultats": ResultatCommune,
+        "stats": ElectionStatsCommune,
+        "cle": ["code_dept", "code_commune"],
+        "candidature": ["code_dept", "code_commune"],
+    },
+    "bureau": {
+        "resultats": ResultatBureau,
+        "stats": ElectionStatsBureau,
+        "cle": ["code_dept", "code_commune", "code_bureau"],
+        "candidature": ["code_dept", "code_commune"],
+    },
+    "circonscription": {
+        "resultats": ResultatCirconscription,
+        "stats": ElectionStatsCirconscription,
+        "cle": ["code_dept", "code_circonscription"],
+        "candidature": ["code_dept", "code_circonscription"],
+    },
+}
+STATS_COLUMNS = ["nb_inscrits", "nb_abstentions", "nb_votants", "nb_blancs_nuls"]
+
+
+class CommuneImporter:
+    """
+    Import en flux des résultats infra-départementaux : commune, bureau
+    de vote ou circonscription législative (fichiers officiels .xlsx ou
+    .csv/.txt séparés par ';'). Sert aussi aux scrutins à nombre de
+    candidats variable (législatives, municipales) : les blocs vides
+    d'une ligne sont ignorés et la nuance éventuelle de chaque candidat
+    est enregistrée dans candidat_nuance.
+
+    Le fichier est lu par paquets de chunk_size lignes, chaque paquet
+    est remis en forme longue en vectorisé puis chargé en masse (COPY
+    sur PostgreSQL), avec un commit et un point de reprise par paquet.
+    Les totaux départementaux ne sont pas stockés : ils s'obtiennent
+    par agrégation (resultats_departement / stats_departement).
+    """
+
+    DEFAULT_CHUNK_SIZE = 20_000
+
+    def __init__(self, session=None, importer=None):
+        self.importer = importer or ElectionImporter(session=session)
+        self.session = self.importer.session
+
+    # =====================================================
+    # Mise en page
+    # =====================================================
+    @staticmethod
+    def detect_layout(header):
+        """
+        Positions des colonnes générales et géométrie des blocs candidats,
+        déduites du premier bloc de l'en-tête (les blocs suivants n'ont
+        souvent pas de libellé). Le bloc commence à « N°Panneau »,
+        « N°Liste », « Code Nuance » ou « Sexe » et s'étend tant que les
+        colonnes appartiennent à BLOCK_COLUMNS.
+        """
+        block_start = min(
+            header.index(col) for col in BLOCK_FIRST_COLUMNS if col in header
+        )
+        block_end = block_start + 1
+        while (
+            block_end < len(header)
+            and header[block_end] in BLOCK_COLUMNS
+            and header[block_end] != header[block_start]
+        ):
+            block_end += 1
+        block = header[block_start:block_end]
+
+        general = {
+            FINE_COLUMN_NAMES[col]: i
+            for i, col in enumerate(header[:block_start])
+            if col in FINE_COLUMN_NAMES
+        }
+        if "code_bureau" in general:
+            niveau = "bureau"
+        elif "code_commune" in general:
+            niveau = "commune"
+        elif "code_circonscription" in general:
+            niveau = "circonscription"
+        else:
+            raise ValueError("Aucune colonne commune, bureau ou circonscription")
+
+        return {
+            "general": general,
+            "niveau": niveau,
+            "block_start": block_start,
+            "block_width": len(block),
+            "candidate_offsets": {
+                BLOCK_ROLES[col]: i for i, col in enumerate(block) if col in BLOCK_ROLES
+            },
+        }
+
+    @classmethod
+    def detect_niveau(cls, path):
+        """
+        Niveau géographique d'un fichier d'après son en-tête : commune,
+        bureau ou circonscription ; None pour un fichier départemental.
+        """
+        try:
+            return cls.detect_layout(read_header(path))["niveau"]
+        except ValueError:
+            return None
+
+    # =====================================================
+    # Préparation vectorisée d'un paquet
+    # =====================================================
+    @staticmethod
+    def normalize_sub_codes(codes, width):
+        codes_str = codes.astype(str).str.strip().str.upper()
+        is_digit = codes_str.str.isdigit()
+        return codes_str.where(~is_digit, codes_str.str.zfill(width))
+
+    def prepare_chunk(self, raw, layout, election_id):
+        """
+        Met en forme un paquet brut. Renvoie la liste ordonnée
+        (table, DataFrame, colonnes de conflit) à charger : dimensions
+        d'abord, faits ensuite.
+        """
+        general = layout["general"]
+        cle = NIVEAUX[layout["niveau"]]["cle"]
+
+        # Comptes illisibles -> NA, écartés (quarantaine) par la validation
+        def numeric(name):
+            return pd.to_numeric(raw[general[name]], errors="coerce").astype("Int64")
+
+        base = pd.DataFrame({
+            "code_dept": ElectionImporter.normalize_codes(raw[general["code_dept"]]),
+        })
+        for col in cle[1:]:
+            base[col] = self.normalize_sub_codes(raw[general[col]], CODE_WIDTHS[col])
+
+        # ---------- DIMENSIONS GÉOGRAPHIQUES ----------
+        df_departement = pd.DataFrame({
+            "code_dept": base["code_dept"],
+            "nom_dept": raw[general["nom_dept"]].astype(str),
+        }).drop_duplicates(subset="code_dept")
+        # Committé avec le reste du paquet et son point de reprise
+        self.importer.import_departements(df_departement, commit=False)
+
+        validate = self.importer.validator.validate
+        niveau = NIVEAUX[layout["niveau"]]
+        tables = []
+        if layout["niveau"] == "circonscription":
+            df_circo = base[cle].copy()
+            if "nom_circonscription" in general:
+                df_circo["libelle"] = raw[general["nom_circonscription"]]
+            tables.append((
+                Circonscription.__table__,
+                validate(Circonscription.__table__, df_circo.drop_duplicates(subset=cle)),
+                cle,
+            ))
+
+        # ---------- STATS ----------
+        df_stats = base.assign(election_id=election_id)
+        if layout["niveau"] != "circonscription" and "nom_commune" in general:
+            df_stats["nom_commune"] = raw[general["nom_commune"]]
+        for col in ["nb_inscrits", "nb_abstentions", "nb_votants"]:
+            df_stats[col] = numeric(col)
+        if "nb_blancs_nuls" in general:
+            df_stats["nb_blancs_nuls"] = numeric("nb_blancs_nuls")
+        else:
+            df_stats["nb_blancs_nuls"] = numeric("nb_blancs") + numeric("nb_nuls")
+
+        # ---------- RÉSULTATS (large -> long) ----------
+        start, width = layout["block_start"], layout["block_width"]
+        num_candidates = (raw.shape[1] - start) // width
+        stop = start + num_candidates * width
+
+        df_long = pd.DataFrame({
+            col: np.tile(base[col].to_numpy(), num_candidates) for col in cle
+        })
+        for col, offset in layout["candidate_offsets"].items():
+            block = raw.iloc[:, start + offset:stop:width]
+            df_long[col] = block.to_numpy().ravel(order="F")
+        # Blocs vides : circonscriptions / communes avec moins de candidats
+        df_long = df_long.dropna(subset=["Nom", "Voix"])
+
+        df_prepared = self.importer.prepare_candidats_resultats(
+            df_long.rename(columns={"code_dept": "Code du département"})
+        )
+        candidat_ids = self.importer.resolve_candidats(df_prepared)
+        df_resultats = df_long[cle].assign(
+            election_id=election_id,
+            candidat_id=candidat_ids,
+            nb_voix=df_prepared["nb_voix"].to_numpy(),
+        )
+
+        # ---------- VALIDATION INTER-TABLES ----------
+        bad_resultats, bad_stats = self.importer.validator.voix_above_votants(
+            df_resultats, df_stats, cle
+        )
+        tables.append((
+            niveau["stats"].__table__,
+            validate(niveau["stats"].__table__, df_stats, election_id,
+                     extra={"voix_le_votants": bad_stats}),
+            ["election_id"] + cle,
+        ))
+        tables.append((
+            niveau["resultats"].__table__,
+            validate(niveau["resultats"].__table__, df_resultats, election_id,
+                     extra={"voix_le_votants": bad_resultats}),
+            ["election_id", "candidat_id"] + cle,
+        ))
+
+        # ---------- NUANCES ----------
+        # Une nuance par candidature : des homonymes (même candidat_id)
+        # de circonscriptions différentes gardent chacun la leur
+        if "Nuance" in df_long.columns:
+            dept_col, circo_col = niveau["candidature"]
+            df_nuance = pd.DataFrame({
+                "election_id": election_id,
+                "candidat_id": candidat_ids,
+                "code_dept": df_long[dept_col].to_numpy(),
+                "code_circonscription": df_long[circo_col].to_numpy(),
+                "nuance_code": df_long["Nuance"].str.strip().to_numpy(),
+            }).dropna(subset="nuance_code").drop_duplicates(
+                subset=["candidat_id", "code_dept", "code_circonscription"]
+            )
+            df_codes = df_nuance[["nuance_code"]].drop_duplicates().rename(
+                columns={"nuance_code": "code"}
+            )
+            tables.append((
+                Nuance.__table__,
+                validate(Nuance.__table__, df_codes),
+                ["code"],
+            ))
+            tables.append((
+                CandidatNuance.__table__,
+                validate(CandidatNuance.__table__, df_nuance, election_id),
+                ["election_id", "candidat_id", "code_dept", "code_circonscription"],
+            ))
+
+        return tables
+
+    # =====================================================
+    # Import
+    # =====================================================
+    def write_table(self, table, df, conflict_columns, overwrite=False):
+        """
+        Charge df dans table. Par défaut les lignes déjà présentes sont
+        conservées (bulk_insert) ; overwrite=True : elles sont mises à
+        jour (fichier corrigé), en un INSERT ... ON CONFLICT DO UPDATE.
+        """
+        update_columns = [col for col in df.columns if col not in conflict_columns]
+        if not overwrite or not update_columns:
+            return bulk_insert(self.session, table, df, conflict_columns)
+
+        stmt = dialect_insert(self.session, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={col: stmt.excluded[col] for col in update_columns}
+        )
+        return execute_frame(self.session, stmt, df)
+
+    def import_file(self, path, election_id, chunk_size=None, resume=True,
+                    source_hash=None, overwrite=False):
+        """
+        Importe un fichier commune ou bureau de vote pour une élection.
+        La reprise n'a lieu que si le point de reprise porte sur le même
+        contenu (source_hash, calculé depuis le fichier à défaut).
+        overwrite=True : fichier corrigé, les lignes déjà stockées sont
+        mises à jour (celles absentes du fichier sont conservées).
+        Retourne le nombre de lignes source traitées.
+        """
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        source_hash = source_hash or FileManifest.file_hash(path)
+        header, chunks = iter_source_chunks(path, chunk_size)
+        layout = self.detect_layout(header)
+        cible = NIVEAUX[layout["niveau"]]["resultats"].__tablename__
+
+        if not self.importer.existing_candidates:
+            self.importer.existing_candidates = self.importer.preload_candidates()
+
+        done = (
+            self.importer.load_checkpoint(election_id, cible, source_hash)
+            if resume else 0
+        )
+        position = 0
+
+        for raw in chunks:
+            position += len(raw)
+            if position <= done:
+                continue  # paquet déjà committé lors d'un import précédent
+
+            for table, df, conflict_columns in self.prepare_chunk(
+                raw, layout, election_id
+            ):
+                self.write_table(table, df, conflict_columns, overwrite)
+
+            # Taille totale inconnue en flux : fixée en fin de fichier
+            self.importer.save_checkpoint(
+                election_id, cible, position, None, source_hash
+            )
+            self.session.commit()
+
+        self.importer.save_checkpoint(
+            election_id, cible, position, position, source_hash
+        )
+        self.session.commit()
+        return position
+
+    # =====================================================
+    # Agrégats départementaux
+    # =====================================================
+    def resultats_departement(self, election_id, niveau="commune"):
+        """Voix par candidat et département, agrégées depuis le niveau fin."""
+        model = NIVEAUX[niveau]["resultats"]
+        query = (
+            select(
+                model.election_id,
+                model.candidat_id,
+                model.code_dept,
+                func.sum(model.nb_voix).label("nb_voix"),
+            )
+            .where(model.election_id == election_id)
+            .group_by(model.election_id, model.candidat_id, model.code_dept)
+        )
+        return pd.DataFrame(self.session.execute(query).all(), columns=[
+            "election_id", "candidat_id", "code_dept", "nb_voix"
+        ])
+
+    def stats_departement(self, election_id, niveau="commune"):
+        """Inscrits, votants, etc. par département, agrégés depuis le niveau fin."""
+        model = NIVEAUX[niveau]["stats"]
+        query = (
+            select(
+                model.election_id,
+                model.code_dept,
+                *[func.sum(getattr(model, col)).label(col) for col in STATS_COLUMNS],
+            )
+            .where(model.election_id == election_id)
+            .group_by(model.election_id, model.code_dept)
+        )
+        return pd.DataFrame(self.session.execute(query).all(), columns=[
+            "election_id", "code_dept", *STATS_COLUMNS
+        ])
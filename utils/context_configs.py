@@ -0,0 +1,71 @@
+from models import Entreprise, Immigration, Menage
+
+ECONOMIE_PATH = "./data/economie"
+POPULATION_PATH = "./data/populations"
+
+# =====================================================
+# Sources des tables de contexte national (une ligne par année)
+# =====================================================
+# Une entrée par table cible :
+#   model      : modèle SQLAlchemy (contrainte d'unicité sur annee)
+#   sources    : fichiers lus puis joints sur l'année, chacun avec
+#                fichier   : fichier Excel source
+#                colonnes  : noms internes, dans l'ordre des colonnes
+#                            (la première est l'année ou la période)
+#                agregation: regroupement par année (ex: "sum" pour des
+#                            trimestres « AAAA-Tn »), optionnel
+#   jointure   : "outer" (aucune année perdue) ou "inner"
+#   transform  : nom d'une fonction de utils/context_loader.py appliquée
+#                au DataFrame joint (indicateurs dérivés), optionnel
+#   annees     : bornes (incluses) des années chargées
+#
+# Ajouter une table de contexte = ajouter une entrée ici.
+CONTEXT_SOURCES = {
+    "menage": {
+        "model": Menage,
+        "sources": [
+            {
+                "fichier": f"{ECONOMIE_PATH}/menage/prix-consommation-base-2018 .xlsx",
+                "colonnes": ["annee", "prix_consommation"],
+            },
+            {
+                "fichier": f"{ECONOMIE_PATH}/menage/epargne.xlsx",
+                "colonnes": ["annee", "taux_epargne"],
+            },
+            {
+                "fichier": f"{ECONOMIE_PATH}/menage/depenses.xlsx",
+                "colonnes": ["annee", "pre_engagees", "logement", "service_multimedia"],
+            },
+        ],
+        "jointure": "outer",
+        "annees": (2007, 2022),
+    },
+    "entreprise": {
+        "model": Entreprise,
+        "sources": [
+            {
+                "fichier": f"{ECONOMIE_PATH}/entreprise/creations-entreprises.xlsx",
+                "colonnes": ["annee", "entreprise", "entrepreneurs"],
+                "agregation": "sum",
+            },
+            {
+                "fichier": f"{ECONOMIE_PATH}/entreprise/echanges-extérieurs-ecc-base-2020.xlsx",
+                "colonnes": ["annee", "exportations", "importations"],
+            },
+        ],
+        "jointure": "inner",
+        "transform": "indicateurs_entreprise",
+        "annees": (2007, 2022),
+    },
+    "immigration": {
+        "model": Immigration,
+        "sources": [
+            {
+                "fichier": f"{POPULATION_PATH}/immigration/immigration.xlsx",
+                "colonnes": ["annee", "pct_immigration"],
+            },
+        ],
+        "jointure": "outer",
+        "annees": (2007, 2022),
+    },
+}
@@ -0,0 +1,135 @@
+from functools import reduce
+
+import pandas as pd
+
+from db.session import SessionLocal
+from db.upsert import dialect_insert
+from utils.context_configs import CONTEXT_SOURCES
+from utils.excel_cache import read_excel_cached
+
+
+# =====================================================
+# Nettoyage
+# =====================================================
+def normaliser_df_contexte(df, colonnes_numeriques, colonne_annee="annee"):
+    """
+    Normalise un DataFrame de données de contexte annuel.
+
+    - Extrait l'année sur 4 chiffres (« 2023 (p) », « 2025-T3 »...)
+    - Nettoie les annotations (ex: (r), %, virgules)
+    - Convertit les colonnes numériques en float (NaN si impossible)
+    """
+    df = df.copy()
+    df[colonne_annee] = (
+        df[colonne_annee].astype(str).str.extract(r"(\d{4})")[0].astype(int)
+    )
+
+    for col in colonnes_numeriques:
+        df[col] = pd.to_numeric(
+            df[col]
+            .astype(str)
+            # Supprimer les annotations type (r), (p), (e)…
+            .str.replace(r"^\(.*?\)\s*", "", regex=True)
+            .str.replace("%", "", regex=False)
+            .str.replace(",", ".", regex=False)
+            .str.strip(),
+            errors="coerce"
+        )
+    return df
+
+
+# =====================================================
+# Indicateurs dérivés (clé "transform" des specs)
+# =====================================================
+def indicateurs_entreprise(df):
+    """
+    Créations d'entreprises (milliers, y compris / hors micro) et
+    échanges extérieurs -> indicateurs de entreprise_contexte.
+    Les croissances sont calculées avant le filtrage des années.
+    """
+    df = df.sort_values("annee")
+    entreprise = df["entreprise"] * 1000
+    entrepreneurs = df["entrepreneurs"] * 1000
+    micro = entreprise - entrepreneurs
+    total = entrepreneurs + micro
+
+    return pd.DataFrame({
+        "annee": df["annee"],
+        "croissance_total_entreprises": total.pct_change(),
+        "ratio_micro": micro / total,
+        "solde_commercial": df["exportations"] - df["importations"],
+        "croissance_export": df["exportations"].pct_change(),
+    }).fillna(0)
+
+
+TRANSFORMS = {
+    "indicateurs_entreprise": indicateurs_entreprise,
+}
+
+
+class ContextLoader:
+    """
+    Chargement des tables de contexte national (une ligne par année)
+    décrites dans utils/context_configs.py : lecture et nettoyage des
+    sources, jointure sur l'année, indicateurs dérivés, puis upsert
+    sur annee. Relancer le chargement met simplement les valeurs à jour.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+
+    # =====================================================
+    # Préparation
+    # =====================================================
+    @staticmethod
+    def read_source(source):
+        df = read_excel_cached(source["fichier"])
+        df.columns = source["colonnes"]
+        df = normaliser_df_contexte(df, source["colonnes"][1:])
+        if "agregation" in source:
+            df = df.groupby("annee", as_index=False).agg(source["agregation"])
+        return df.drop_duplicates(subset="annee", keep="first")
+
+    def prepare(self, spec):
+        """DataFrame final d'une spec : une ligne par année, colonnes du modèle."""
+        df = reduce(
+            lambda left, right: left.merge(right, on="annee", how=spec["jointure"]),
+            [self.read_source(source) for source in spec["sources"]]
+        )
+        if "transform" in spec:
+            df = TRANSFORMS[spec["transform"]](df)
+
+        annee_min, annee_max = spec["annees"]
+        df = df[df["annee"].between(annee_min, annee_max)]
+
+        colonnes = [
+            col.name for col in spec["model"].__table__.columns
+            if col.name in df.columns
+        ]
+        return df[colonnes].sort_values("annee").reset_index(drop=True)
+
+    # =====================================================
+    # Chargement
+    # =====================================================
+    def load(self, name):
+        """Upsert d'une table de contexte ; retourne le nombre d'années."""
+        spec = CONTEXT_SOURCES[name]
+        df = self.prepare(spec)
+        if df.empty:
+            return 0
+
+        records = [
+            {col: (None if pd.isna(value) else value) for col, value in row.items()}
+            for row in df.astype(object).to_dict("records")
+        ]
+        stmt = dialect_insert(self.session, spec["model"].__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["annee"],
+            set_={col: stmt.excluded[col] for col in df.columns if col != "annee"}
+        )
+        self.session.execute(stmt, records)
+        self.session.commit()
+        return len(records)
+
+    def load_all(self, names=None):
+        return {name: self.load(name) for name in names or CONTEXT_SOURCES}
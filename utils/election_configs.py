@@ -0,0 +1,80 @@
+from datetime import date
+
+from enums.type_election import TypeElection
+
+BASE_PATH = "./data/elections"
+
+# =====================================================
+# Configuration des scrutins importables
+# =====================================================
+# Une entrée par élection, un sous-dictionnaire par tour :
+#   date      : date du scrutin
+#   fichier   : fichier source (la mise en page est détectée sur l'en-tête)
+#   drop_rows : index de lignes à écarter avant traitement (optionnel)
+#   niveau    : optionnel. Le niveau géographique est détecté sur
+#               l'en-tête (colonnes commune, bureau de vote ou
+#               circonscription -> import en flux par CommuneImporter,
+#               sinon fichier départemental). S'il est renseigné, il
+#               doit correspondre au niveau détecté.
+#
+# Ajouter un scrutin = ajouter une entrée ici.
+ELECTIONS = {
+    "presidentielle-2012": {
+        "type_election": TypeElection.PRESIDENTIELLE,
+        "tours": {
+            1: {
+                "date": date(2012, 4, 22),
+                "fichier": f"{BASE_PATH}/presidentielles-2012-1.xlsx",
+            },
+            2: {
+                "date": date(2012, 5, 6),
+                "fichier": f"{BASE_PATH}/presidentielles-2012-2.xlsx",
+                # Ligne vide en fin de fichier
+                "drop_rows": [107],
+            },
+        },
+    },
+    "presidentielle-2017": {
+        "type_election": TypeElection.PRESIDENTIELLE,
+        "tours": {
+            1: {
+                "date": date(2017, 4, 23),
+                "fichier": f"{BASE_PATH}/presidentielles-2017-1.xlsx",
+            },
+            2: {
+                "date": date(2017, 5, 7),
+                "fichier": f"{BASE_PATH}/presidentielles-2017-2.xlsx",
+            },
+        },
+    },
+    "presidentielle-2022": {
+        "type_election": TypeElection.PRESIDENTIELLE,
+        "tours": {
+            1: {
+                "date": date(2022, 4, 10),
+                "fichier": f"{BASE_PATH}/presidentielles-2022-1.xlsx",
+            },
+            2: {
+                "date": date(2022, 4, 24),
+                "fichier": f"{BASE_PATH}/presidentielles-2022-2.xlsx",
+            },
+        },
+    },
+    # Législatives : fichiers par circonscription (lignes de longueur
+    # variable, un bloc par candidat), importés via CommuneImporter.
+    # "legislatives-2022": {
+    #     "type_election": TypeElection.LEGISLATIVE,
+    #     "tours": {
+    #         1: {
+    #             "date": date(2022, 6, 12),
+    #             "fichier": f"{BASE_PATH}/legislatives-2022-1-circo.txt",
+    #             "niveau": "circonscription",
+    #         },
+    #         2: {
+    #             "date": date(2022, 6, 19),
+    #             "fichier": f"{BASE_PATH}/legislatives-2022-2-circo.txt",
+    #             "niveau": "circonscription",
+    #         },
+    #     },
+    # },
+}
@@ -1,8 +1,11 @@
+import numpy as np
 import pandas as pd
 
+from utils.excel_cache import read_excel_cached
+
 class ElectionDataFrame:
     def __init__(self, excel_path: str):
-        self.df = pd.read_excel(excel_path)
+        self.df = read_excel_cached(excel_path)
 
         # Nettoyage initial
         self._prepare_infos_generales()
@@ -46,33 +49,36 @@ class ElectionDataFrame:
     # =====================================================
     def _prepare_candidats(self):
         cols_globales = ["Code du département", "Libellé du département"]
+        candidate_cols = ["Sexe", "Nom", "Prenom", "Voix"]
         df_candidates = self.df.iloc[:, 17:]
         cols_per_candidate = 6
         num_candidates = df_candidates.shape[1] // cols_per_candidate
 
-        dfs = []
-
-        for i in range(num_candidates):
-            start = i * cols_per_candidate
-            end = start + cols_per_candidate
-
-            df_cand = df_candidates.iloc[:, start:end].copy()
-            df_cand.columns = [
-                "Sexe", "Nom", "Prenom", "Voix",
-                "% Voix/Ins", "% Voix/Exp"
+        # Passage large -> long champ par champ : la colonne j de chaque
+        # bloc candidat est lue par pas de cols_per_candidate et aplatie
+        # candidat par candidat ; les colonnes département sont répétées.
+        # Blocs numériques : aplatis en numpy. Texte (Arrow) et types
+        # mélangés : colonnes mises bout à bout, sans tableau objet.
+        data = {
+            col: pd.concat([self.df[col]] * num_candidates, ignore_index=True)
+            for col in cols_globales
+        }
+        for j, col in enumerate(candidate_cols):
+            block = df_candidates.iloc[
+                :, j:num_candidates * cols_per_candidate:cols_per_candidate
             ]
-
-            df_cand = pd.concat(
-                [self.df[cols_globales], df_cand],
-                axis=1
-            )
-
-            dfs.append(df_cand)
-
-        self.df_candidat_resultat = (
-            pd.concat(dfs, ignore_index=True)
-            [["Code du département", "Libellé du département",
-              "Sexe", "Nom", "Prenom", "Voix"]]
+            data[col] = self._flatten_block(block)
+
+        self.df_candidat_resultat = pd.DataFrame(data)
+
+    @staticmethod
+    def _flatten_block(block):
+        """Colonnes de block mises bout à bout, en conservant leur type."""
+        dtypes = block.dtypes.unique()
+        if len(dtypes) == 1 and isinstance(dtypes[0], np.dtype) and dtypes[0] != object:
+            return pd.Series(block.to_numpy().ravel(order="F"), dtype=dtypes[0])
+        return pd.concat(
+            [block.iloc[:, k] for k in range(block.shape[1])], ignore_index=True
         )
 
     # =====================================================
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 
@@ -33,6 +34,19 @@ class ElectionDataFrame:
                 filter_default).astype(str).str.capitalize()
         )
 
+    def _complete_rows(self):
+        """
+        Masque des lignes retenues : départements dont la saisie vaut
+        filter_value, ou toutes les lignes avec keep_partial (remontées
+        partielles du soir d'élection). Appliqué aux stats comme aux
+        résultats candidats, pour qu'ils portent sur les mêmes départements.
+        """
+        if self.config.get("keep_partial", False):
+            return pd.Series(True, index=self.df.index)
+        filter_col = self.config.get("filter_column", "etat_saisie")
+        filter_val = self.config.get("filter_value", "Complet")
+        return self.df[filter_col] == filter_val
+
     # =====================================================
     # 🔹 Normalisation code département
     # =====================================================
@@ -61,11 +75,7 @@ class ElectionDataFrame:
         self.df_infos_general.columns = general_info_cols
 
         # Filtrage selon la colonne configurée
-        filter_col = self.config.get("filter_column", "etat_saisie")
-        filter_val = self.config.get("filter_value", "Complet")
-        self.df_infos_general = self.df_infos_general.loc[
-            self.df_infos_general[filter_col] == filter_val
-        ].copy()
+        self.df_infos_general = self.df_infos_general.loc[self._complete_rows()].copy()
 
         # DataFrame avec colonnes chiffrées
         numeric_cols = self.config.get(
@@ -100,26 +110,42 @@ class ElectionDataFrame:
         )
         n_cols_per_candidate = self.config.get("n_cols_per_candidate", 6)
 
-        df_candidates = self.df.iloc[:, self.config.get("n_general_cols", 17):]
+        # Mêmes départements que les stats (filtre etat_saisie)
+        df_source = self.df.loc[self._complete_rows()]
+        df_candidates = df_source.iloc[:, self.config.get("n_general_cols", 17):]
         num_candidates = df_candidates.shape[1] // n_cols_per_candidate
-        dfs = []
-
-        for i in range(num_candidates):
-            start = i * n_cols_per_candidate
-            end = start + n_cols_per_candidate
-            df_cand = df_candidates.iloc[:, start:end].copy()
-            df_cand.columns = candidate_cols
-            df_cand = pd.concat(
-                [self.df[cols_globales].copy(), df_cand], axis=1)
 
-            # Normaliser les codes de département
-            df_cand.loc[:, cols_globales[0]] = df_cand[cols_globales[0]].map(
-                self.normalize_code)
+        # Colonnes globales normalisées une seule fois puis répétées
+        # pour chaque bloc candidat
+        df_globales = df_source[cols_globales].copy()
+        df_globales[cols_globales[0]] = df_globales[cols_globales[0]].map(
+            self.normalize_code)
+        data = {
+            col: pd.concat([df_globales[col]] * num_candidates, ignore_index=True)
+            for col in cols_globales
+        }
+
+        # Colonne j de chaque bloc : lecture par pas de n_cols_per_candidate,
+        # aplatie candidat par candidat (même ordre que l'ancienne boucle).
+        # Blocs numériques : aplatis en numpy. Texte (Arrow) et types
+        # mélangés : colonnes mises bout à bout, sans tableau objet.
+        for j, col in enumerate(candidate_cols[:4]):
+            block = df_candidates.iloc[
+                :, j:num_candidates * n_cols_per_candidate:n_cols_per_candidate
+            ]
+            data[col] = self._flatten_block(block)
+
+        self.df_candidat_resultat = pd.DataFrame(data)
 
-            dfs.append(df_cand)
-
-        self.df_candidat_resultat = pd.concat(
-            dfs, ignore_index=True).loc[:, cols_globales + candidate_cols[:4]].copy()
+    @staticmethod
+    def _flatten_block(block):
+        """Colonnes de block mises bout à bout, en conservant leur type."""
+        dtypes = block.dtypes.unique()
+        if len(dtypes) == 1 and isinstance(dtypes[0], np.dtype) and dtypes[0] != object:
+            return pd.Series(block.to_numpy().ravel(order="F"), dtype=dtypes[0])
+        return pd.concat(
+            [block.iloc[:, k] for k in range(block.shape[1])], ignore_index=True
+        )
 
     # =====================================================
     # 3️⃣ MÉTHODES MÉTIER
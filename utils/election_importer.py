@@ -1,8 +1,20 @@
+import hashlib
 from datetime import date
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, tuple_
+
+from db.bulk import bulk_insert, execute_frame
 from db.session import SessionLocal
+from db.upsert import dialect_insert
 from enums.sexe import SexeEnum
 from enums.type_election import TypeElection
-from models import Departement, Election, ElectionStats, Candidat, ResultatElection
+from models import (
+    Departement, Election, ElectionStats, Candidat, ResultatElection,
+    ImportCheckpoint,
+)
+from utils.validation import PreInsertValidator
 
 
 class ElectionImporter:
@@ -11,10 +23,15 @@ class ElectionImporter:
     depuis des DataFrames vers la base de données.
     """
 
+    RESULTATS_COLUMNS = ["election_id", "candidat_id", "code_dept", "nb_voix"]
+    STATS_COLUMNS = ["nb_inscrits", "nb_abstentions", "nb_votants", "nb_blancs_nuls"]
+    DEFAULT_CHUNK_SIZE = 50_000
+
     def __init__(self, session=None):
         self.session = session or SessionLocal()
         self.existing_candidates = {}
-        self.existing_results = {}
+        self.existing_results = set()
+        self.validator = PreInsertValidator(self.session)
 
     # =====================================================
     # Normalisation
@@ -28,84 +45,140 @@ class ElectionImporter:
     def normalize_name(value: str) -> str:
         return value.strip().upper()
 
+    @staticmethod
+    def normalize_codes(codes: pd.Series) -> pd.Series:
+        """Version vectorisée de normalize_code sur une colonne entière."""
+        codes_str = codes.astype(str).str.strip().str.upper()
+        is_digit = codes_str.str.isdigit()
+        return codes_str.where(~is_digit, codes_str.str.zfill(2))
+
     # =====================================================
     # Préchargement
     # =====================================================
     def preload_candidates(self):
         """
-        Cache candidats existants
-        clé = (nom, prenom, sexe)
+        Cache candidats existants (requête colonnes, sans objets ORM)
+        clé = (nom, prenom, sexe), valeur = candidat_id
         """
         return {
-            (
-                c.nom.upper(),
-                c.prenom.upper(),
-                c.sexe
-            ): c
-            for c in self.session.query(Candidat).all()
+            (nom.upper(), prenom.upper(), sexe): candidat_id
+            for candidat_id, nom, prenom, sexe in self.session.query(
+                Candidat.id, Candidat.nom, Candidat.prenom, Candidat.sexe
+            )
         }
 
     def preload_results(self, election_id):
         """
-        Cache résultats existants
+        Cache des clés de résultats existants (requête colonnes)
         clé = (election_id, candidat_id, code_dept)
         """
         return {
-            (
-                r.election_id,
-                r.candidat_id,
-                r.code_dept
-            ): r
-            for r in self.session.query(ResultatElection)
-            .filter_by(election_id=election_id)
-            .all()
+            (election_id, candidat_id, code_dept)
+            for candidat_id, code_dept in self.session.query(
+                ResultatElection.candidat_id, ResultatElection.code_dept
+            ).filter_by(election_id=election_id)
         }
 
     # =====================================================
     # Départements
     # =====================================================
-    def import_departements(self, df_departement):
+    def import_departements(self, df_departement, commit=True):
         """
-        Importe ou met à jour les départements depuis un DataFrame.
-        Les codes sont normalisés.
+        Importe ou met à jour les départements depuis un DataFrame,
+        en un seul INSERT ... ON CONFLICT (code_dept) DO UPDATE.
+        Les codes sont normalisés, le frame est dédoublonné
+        (la dernière occurrence d'un code l'emporte) et trié, pour que
+        des imports concurrents verrouillent les lignes dans le même ordre.
+        commit=False : laissé à l'appelant (import par paquets).
+        Retourne {"inserted": n, "updated": n, "unchanged": n}.
         """
-        for _, row in df_departement.iterrows():
-            dept = Departement(
-                code_dept=self.normalize_code(row.code_dept),
-                nom_dept=row.nom_dept.lower()
-            )
-            self.session.merge(dept)  # merge pour insert ou update
-        self.session.commit()
+        df = pd.DataFrame({
+            "code_dept": self.normalize_codes(df_departement["code_dept"]),
+            "nom_dept": df_departement["nom_dept"].str.lower(),
+        }).drop_duplicates(subset="code_dept", keep="last").sort_values("code_dept")
+        df = self.validator.validate(Departement.__table__, df)
+
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        if df.empty:
+            return counts
+
+        existing = dict(
+            self.session.query(Departement.code_dept, Departement.nom_dept)
+            .filter(Departement.code_dept.in_(df["code_dept"].tolist()))
+            .all()
+        )
+        nom_existant = df["code_dept"].map(existing)
+        is_new = nom_existant.isna()
+        is_changed = ~is_new & (nom_existant != df["nom_dept"])
+
+        counts["inserted"] = int(is_new.sum())
+        counts["updated"] = int(is_changed.sum())
+        counts["unchanged"] = len(df) - counts["inserted"] - counts["updated"]
+
+        stmt = dialect_insert(self.session, Departement).values(df.to_dict("records"))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["code_dept"],
+            set_={"nom_dept": stmt.excluded.nom_dept},
+            where=Departement.nom_dept != stmt.excluded.nom_dept
+        )
+        self.session.execute(stmt)
+        if commit:
+            self.session.commit()
+        self.validator.add_known_codes(df["code_dept"])
+        return counts
 
     # =====================================================
     # Stats par département
     # =====================================================
 
-    def import_stats(self, df_stats, election_id):
+    def import_stats(self, df_stats, election_id, on_conflict="skip"):
         """
-        Importe les statistiques par département.
-        Les codes sont normalisés.
+        Importe les statistiques par département en un seul
+        INSERT multi-lignes ... ON CONFLICT (code_dept, election_id),
+        appuyé sur uq_electionstats_dept_election.
+
+        on_conflict="skip"      : les stats déjà présentes sont conservées
+        on_conflict="overwrite" : les stats déjà présentes sont remplacées
+        Retourne le nombre de lignes insérées ou mises à jour.
         """
-        for _, row in df_stats.iterrows():
-            code_dept_norm = self.normalize_code(row.code_dept)
-            exists = (
-                self.session.query(ElectionStats)
-                .filter_by(code_dept=code_dept_norm, election_id=election_id)
-                .first()
+        if on_conflict not in ("skip", "overwrite"):
+            raise ValueError(
+                f"on_conflict doit valoir 'skip' ou 'overwrite', pas '{on_conflict}'"
+            )
+
+        df = df_stats.copy()
+        df["code_dept"] = self.normalize_codes(df["code_dept"])
+        df = df.drop_duplicates(subset="code_dept", keep="first")
+        df = self.validator.validate(
+            ElectionStats.__table__, df.assign(election_id=election_id), election_id
+        )
+        if df.empty:
+            return 0
+
+        records = [
+            {
+                "code_dept": code_dept,
+                "election_id": election_id,
+                **{col: int(value) for col, value in zip(self.STATS_COLUMNS, values)},
+            }
+            for code_dept, *values in df[["code_dept"] + self.STATS_COLUMNS].itertuples(
+                index=False, name=None
             )
-            if exists:
-                continue
-
-            stats = ElectionStats(
-                code_dept=code_dept_norm,
-                election_id=election_id,
-                nb_inscrits=int(row.nb_inscrits),
-                nb_abstentions=int(row.nb_abstentions),
-                nb_votants=int(row.nb_votants),
-                nb_blancs_nuls=int(row.nb_blancs_nuls),
+        ]
+
+        stmt = dialect_insert(self.session, ElectionStats).values(records)
+        conflict_cols = ["code_dept", "election_id"]
+        if on_conflict == "overwrite":
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_cols,
+                set_={col: stmt.excluded[col] for col in self.STATS_COLUMNS}
             )
-            self.session.add(stats)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
+
+        result = self.session.execute(stmt)
         self.session.commit()
+        return result.rowcount
 
     # =====================================================
     # Élections
@@ -137,8 +210,52 @@ class ElectionImporter:
         )
         self.session.add(candidat)
         self.session.flush()  # garantit candidat.id
+        self.session.expunge(candidat)  # seul l'id est conservé en cache
         return candidat
 
+    def create_candidats(self, keys):
+        """
+        Crée en une requête INSERT ... RETURNING les candidats inconnus
+        et complète existing_candidates avec leurs ids.
+        keys = liste de (nom, prenom, sexe)
+        """
+        if not keys:
+            return
+
+        # Imports parallèles : ON CONFLICT DO NOTHING et la relecture
+        # ci-dessous arbitrent les doublons ; l'ordre d'insertion fixe
+        # évite les interblocages entre transactions concurrentes
+        keys = sorted(keys, key=lambda key: (key[0], key[1], key[2].value))
+
+        # executemany + RETURNING : requête compilée une fois, envoyée
+        # en lots multi-lignes (insertmanyvalues)
+        stmt = (
+            dialect_insert(self.session, Candidat.__table__)
+            .on_conflict_do_nothing(index_elements=["nom", "prenom", "sexe"])
+            .returning(
+                Candidat.id, Candidat.nom, Candidat.prenom, Candidat.sexe,
+                sort_by_parameter_order=True
+            )
+        )
+        rows = self.session.execute(stmt, [
+            {"nom": nom, "prenom": prenom, "sexe": sexe}
+            for nom, prenom, sexe in keys
+        ])
+        for candidat_id, nom, prenom, sexe in rows:
+            self.existing_candidates[(nom, prenom, sexe)] = candidat_id
+
+        # Candidats créés entre le préchargement et l'INSERT : DO NOTHING
+        # ne les renvoie pas, on relit leurs ids.
+        missing = [key for key in keys if key not in self.existing_candidates]
+        if missing:
+            rows = self.session.query(
+                Candidat.id, Candidat.nom, Candidat.prenom, Candidat.sexe
+            ).filter(
+                tuple_(Candidat.nom, Candidat.prenom, Candidat.sexe).in_(missing)
+            )
+            for candidat_id, nom, prenom, sexe in rows:
+                self.existing_candidates[(nom, prenom, sexe)] = candidat_id
+
     # =====================================================
     # Résultats
     # =====================================================
@@ -165,35 +282,349 @@ class ElectionImporter:
 
         # ---------- CANDIDAT ----------
         key_cand = (nom, prenom, sexe)
-        candidat = self.existing_candidates.get(key_cand)
+        candidat_id = self.existing_candidates.get(key_cand)
 
-        if not candidat:
-            candidat = self.get_or_create_candidat(nom, prenom, sexe)
-            self.existing_candidates[key_cand] = candidat
+        if not candidat_id:
+            candidat_id = self.get_or_create_candidat(nom, prenom, sexe).id
+            self.existing_candidates[key_cand] = candidat_id
 
         # ---------- RESULTAT ----------
-        key_res = (election_id, candidat.id, code_dept)
+        key_res = (election_id, candidat_id, code_dept)
 
         if key_res in self.existing_results:
             return
 
-        resultat = self.get_or_create_resultat(
+        self.get_or_create_resultat(
             election_id,
             code_dept,
-            candidat.id,
+            candidat_id,
             nb_voix
         )
 
-        self.existing_results[key_res] = resultat
+        self.existing_results.add(key_res)
 
     # =====================================================
     # Import massif
     # =====================================================
-    def import_candidats_resultats(self, df, election_id):
-        self.existing_candidates = self.preload_candidates()
+    def import_candidats_resultats(self, df, election_id, bulk=True,
+                                   chunk_size=None, resume=True, source_hash=None):
+        """
+        Importe les résultats candidats d'une élection, par paquets de
+        chunk_size lignes source avec un commit (et un point de reprise)
+        par paquet.
+
+        bulk=True  : chargement en masse (défaut) : COPY sur PostgreSQL,
+                     INSERT ... SELECT sur une vue du DataFrame sur
+                     DuckDB, executemany sinon
+        bulk=False : chemin ORM (un objet par résultat)
+        resume=True  : reprend après la dernière ligne committée, si le
+                       point de reprise porte sur la même source et n'est
+                       pas terminé
+        resume=False : repart du début du DataFrame
+        source_hash  : empreinte de la source (celle du fichier) ; à
+                       défaut, empreinte du DataFrame
+        """
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+        # Le cache candidats reste chaud d'une élection à l'autre
+        if not self.existing_candidates:
+            self.existing_candidates = self.preload_candidates()
         self.existing_results = self.preload_results(election_id)
 
-        for _, row in df.iterrows():
-            self.import_candidat_resultat_ligne(row, election_id)
+        cible = ResultatElection.__tablename__
+        source_hash = source_hash or self.frame_hash(df)
+        start = self.load_checkpoint(election_id, cible, source_hash) if resume else 0
+
+        for start in range(start, len(df), chunk_size):
+            chunk = df.iloc[start:start + chunk_size]
+            self.import_resultats_chunk(chunk, election_id, bulk)
+            self.save_checkpoint(
+                election_id, cible, start + len(chunk), len(df), source_hash
+            )
+            self.session.commit()
+
+    def import_resultats_chunk(self, df, election_id, bulk):
+        df_resultats = self.prepare_resultats(df, election_id)
+
+        if bulk:
+            self.bulk_resultats(df_resultats)
+        else:
+            resultats = [
+                self.get_or_create_resultat(
+                    election_id, code_dept, candidat_id, nb_voix
+                )
+                for candidat_id, code_dept, nb_voix in df_resultats[
+                    ["candidat_id", "code_dept", "nb_voix"]
+                ].itertuples(index=False, name=None)
+            ]
+            self.session.flush()
+            # Les objets insérés ne sont plus utiles : on vide l'identity map
+            for resultat in resultats:
+                self.session.expunge(resultat)
+
+        self.existing_results.update(
+            df_resultats[["election_id", "candidat_id", "code_dept"]]
+            .itertuples(index=False, name=None)
+        )
+
+    # =====================================================
+    # Import différentiel (fichier corrigé)
+    # =====================================================
+    def import_candidats_resultats_delta(self, df, election_id,
+                                         delete_missing=False):
+        """
+        Réapplique un fichier corrigé : le DataFrame préparé est comparé
+        (anti-jointure) aux résultats stockés sur
+        (election_id, candidat_id, code_dept, nb_voix), et seules les
+        différences sont écrites.
+
+        - nouvelles lignes et nb_voix modifiés : un seul
+          INSERT ... ON CONFLICT DO UPDATE
+        - delete_missing=True : les résultats absents du fichier sont
+          supprimés en un seul DELETE
+
+        Retourne {"inserted": n, "updated": n, "deleted": n, "unchanged": n}.
+        """
+        df_prepared = self.prepare_candidats_resultats(df)
+        df_prepared["candidat_id"] = self.resolve_candidats(df_prepared)
+        df_new = self.validator.validate(
+            ResultatElection.__table__,
+            df_prepared.drop_duplicates(
+                subset=["candidat_id", "code_dept"], keep="first"
+            ).assign(election_id=election_id)[self.RESULTATS_COLUMNS],
+            election_id
+        )[["candidat_id", "code_dept", "nb_voix"]]
+
+        df_stored = pd.DataFrame(
+            self.session.query(
+                ResultatElection.candidat_id,
+                ResultatElection.code_dept,
+                ResultatElection.nb_voix,
+            ).filter_by(election_id=election_id).all(),
+            columns=["candidat_id", "code_dept", "nb_voix"],
+        )
+
+        diff = df_new.merge(
+            df_stored, on=["candidat_id", "code_dept"], how="outer",
+            suffixes=("", "_stored"), indicator=True
+        )
+        is_new = diff["_merge"] == "left_only"
+        is_changed = (diff["_merge"] == "both") & (diff["nb_voix"] != diff["nb_voix_stored"])
+        is_missing = diff["_merge"] == "right_only"
+
+        counts = {
+            "inserted": int(is_new.sum()),
+            "updated": int(is_changed.sum()),
+            "deleted": int(is_missing.sum()) if delete_missing else 0,
+            "unchanged": int(((diff["_merge"] == "both") & ~is_changed).sum()),
+        }
+
+        df_upsert = diff.loc[is_new | is_changed, ["candidat_id", "code_dept", "nb_voix"]]
+        if not df_upsert.empty:
+            df_upsert = pd.DataFrame({
+                "election_id": election_id,
+                "candidat_id": df_upsert["candidat_id"].astype("int64"),
+                "code_dept": df_upsert["code_dept"],
+                "nb_voix": df_upsert["nb_voix"].astype("int64"),
+            })
+            table = ResultatElection.__table__
+            stmt = dialect_insert(self.session, table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["election_id", "candidat_id", "code_dept"],
+                set_={"nb_voix": stmt.excluded.nb_voix},
+                where=table.c.nb_voix != stmt.excluded.nb_voix
+            )
+            execute_frame(self.session, stmt, df_upsert)
+
+        if delete_missing and counts["deleted"]:
+            keys = [
+                (int(candidat_id), code_dept)
+                for candidat_id, code_dept in diff.loc[
+                    is_missing, ["candidat_id", "code_dept"]
+                ].itertuples(index=False, name=None)
+            ]
+            self.session.execute(
+                ResultatElection.__table__.delete().where(
+                    ResultatElection.election_id == election_id,
+                    tuple_(ResultatElection.candidat_id, ResultatElection.code_dept).in_(keys)
+                )
+            )
 
         self.session.commit()
+        self.existing_results = self.preload_results(election_id)
+        return counts
+
+    # =====================================================
+    # Points de reprise
+    # =====================================================
+    @staticmethod
+    def frame_hash(df):
+        """Empreinte SHA-256 du contenu d'un DataFrame (index compris)."""
+        return hashlib.sha256(
+            pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+        ).hexdigest()
+
+    def load_checkpoint(self, election_id, cible, source_hash):
+        """
+        Position de la première ligne source non encore importée.
+        0 s'il n'y a pas de point de reprise, si l'import précédent est
+        terminé ou s'il portait sur une autre version de la source.
+        """
+        checkpoint = (
+            self.session.query(
+                ImportCheckpoint.derniere_ligne,
+                ImportCheckpoint.termine,
+                ImportCheckpoint.hash_source,
+            )
+            .filter_by(election_id=election_id, cible=cible)
+            .first()
+        )
+        if checkpoint is None:
+            return 0
+        derniere_ligne, termine, hash_source = checkpoint
+        if termine or hash_source != source_hash:
+            return 0
+        return derniere_ligne
+
+    def save_checkpoint(self, election_id, cible, derniere_ligne, nb_lignes,
+                        source_hash):
+        """
+        Enregistre l'avancement ; committé avec le paquet de lignes.
+        nb_lignes=None : taille de la source encore inconnue (lecture en flux).
+        """
+        values = {
+            "hash_source": source_hash,
+            "derniere_ligne": derniere_ligne,
+            "nb_lignes": nb_lignes,
+            "termine": nb_lignes is not None and derniere_ligne >= nb_lignes,
+            "updated_at": func.now(),
+        }
+        stmt = dialect_insert(self.session, ImportCheckpoint).values(
+            election_id=election_id, cible=cible, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["election_id", "cible"],
+            set_=values
+        )
+        self.session.execute(stmt)
+
+    # =====================================================
+    # Préparation vectorisée
+    # =====================================================
+    def prepare_candidats_resultats(self, df):
+        """
+        Normalise colonne par colonne le DataFrame brut des résultats :
+        nom / prenom en majuscules, code département sur 2 caractères,
+        sexe converti en SexeEnum.
+        """
+        return pd.DataFrame(
+            {
+                "nom": df["Nom"].str.strip().str.upper(),
+                "prenom": df["Prenom"].str.strip().str.upper(),
+                "sexe": np.where(df["Sexe"] == "M", SexeEnum.M, SexeEnum.F),
+                "code_dept": self.normalize_codes(df["Code du département"]),
+                "nb_voix": pd.to_numeric(df["Voix"], errors="coerce").astype("Int64"),
+            },
+            index=df.index
+        )
+
+    def resolve_candidats(self, df_prepared):
+        """
+        Résout l'id candidat de chaque ligne préparée.
+        Les candidats inconnus sont créés en un seul INSERT ... RETURNING,
+        triés par (nom, prénom, sexe) : leurs ids suivent cet ordre.
+        """
+        keys = df_prepared[["nom", "prenom", "sexe"]].drop_duplicates()
+        key_tuples = list(keys.itertuples(index=False, name=None))
+
+        self.create_candidats([
+            key for key in key_tuples if key not in self.existing_candidates
+        ])
+
+        keys = keys.assign(
+            candidat_id=[self.existing_candidates[key] for key in key_tuples]
+        )
+        return df_prepared.merge(keys, on=["nom", "prenom", "sexe"], how="left")[
+            "candidat_id"
+        ].to_numpy()
+
+    def prepare_resultats(self, df, election_id):
+        """
+        Construit le DataFrame normalisé des résultats à insérer
+        (colonnes RESULTATS_COLUMNS), candidats résolus et
+        résultats déjà connus écartés.
+        """
+        df_prepared = self.prepare_candidats_resultats(df)
+        df_prepared["candidat_id"] = self.resolve_candidats(df_prepared)
+        df_prepared["election_id"] = election_id
+
+        df_resultats = df_prepared.drop_duplicates(
+            subset=["candidat_id", "code_dept"], keep="first"
+        )[self.RESULTATS_COLUMNS]
+        df_resultats = self.validator.validate(
+            ResultatElection.__table__, df_resultats, election_id
+        )
+
+        if self.existing_results:
+            keys = pd.MultiIndex.from_frame(
+                df_resultats[["election_id", "candidat_id", "code_dept"]]
+            )
+            df_resultats = df_resultats[~keys.isin(list(self.existing_results))]
+
+        return df_resultats.reset_index(drop=True)
+
+    # =====================================================
+    # Validation inter-tables
+    # =====================================================
+    def check_voix_votants(self, df_stats, df_candidats, election_id):
+        """
+        Écarte (et met en quarantaine) les départements dont la somme des
+        voix dépasse nb_votants, avant tout envoi SQL.
+        Retourne (df_stats, df_candidats) filtrés.
+        """
+        stats = pd.DataFrame({
+            "code_dept": self.normalize_codes(df_stats["code_dept"]),
+            "nb_votants": df_stats["nb_votants"],
+        })
+        resultats = pd.DataFrame({
+            "code_dept": self.normalize_codes(df_candidats["Code du département"]),
+            "nb_voix": pd.to_numeric(df_candidats["Voix"], errors="coerce"),
+        })
+        bad_resultats, bad_stats = self.validator.voix_above_votants(
+            resultats, stats, ["code_dept"]
+        )
+        if not bad_stats.any():
+            return df_stats, df_candidats
+
+        failures = pd.DataFrame({"voix_le_votants": True}, index=df_stats.index[bad_stats])
+        self.validator.quarantine(
+            ElectionStats.__tablename__, df_stats[bad_stats], failures, election_id
+        )
+        failures = pd.DataFrame(
+            {"voix_le_votants": True}, index=df_candidats.index[bad_resultats]
+        )
+        self.validator.quarantine(
+            ResultatElection.__tablename__, df_candidats[bad_resultats], failures,
+            election_id
+        )
+        return df_stats[~bad_stats], df_candidats[~bad_resultats]
+
+    # =====================================================
+    # Chargement en masse
+    # =====================================================
+    def bulk_resultats(self, df_resultats):
+        """
+        Charge les résultats par db.bulk.bulk_insert (COPY sur
+        PostgreSQL, vue du DataFrame sur DuckDB, executemany sinon), en
+        ignorant les doublons de uq_resultat_election_candidat_dept.
+        Retourne le nombre de lignes insérées.
+        """
+        if df_resultats.empty:
+            return 0
+
+        return bulk_insert(
+            self.session,
+            ResultatElection.__table__,
+            df_resultats[self.RESULTATS_COLUMNS],
+            ["election_id", "candidat_id", "code_dept"]
+        )
@@ -0,0 +1,101 @@
+import pandas as pd
+
+from utils.election_dataframe2 import ElectionDataFrame
+from utils.excel_cache import read_excel_cached
+
+# Libellés officiels des colonnes générales -> noms internes
+GENERAL_COLUMN_NAMES = {
+    "Code du département": "code_dept",
+    "Libellé du département": "nom_dept",
+    "Etat saisie": "etat_saisie",
+    "Inscrits": "nb_inscrits",
+    "Abstentions": "nb_abstentions",
+    "Votants": "nb_votants",
+    "Blancs et nuls": "nb_blancs_nuls",
+    "Blancs": "nb_blancs",
+    "Nuls": "nb_nuls",
+    "Exprimés": "nb_exprimes",
+}
+FIRST_CANDIDATE_COLUMN = "Sexe"
+
+
+# =====================================================
+# Détection de la mise en page
+# =====================================================
+def read_header(path):
+    """Ligne d'en-tête d'un fichier .xlsx ou .csv/.txt (séparateur ';')."""
+    if path.endswith((".csv", ".txt")):
+        return list(pd.read_csv(path, sep=";", encoding="latin-1", nrows=0).columns)
+    return list(pd.read_excel(path, nrows=0).columns)
+
+
+def detect_layout(path):
+    """
+    Construit la configuration ElectionDataFrame d'un fichier à partir
+    de sa seule ligne d'en-tête (13, 16 ou 17 colonnes générales,
+    blancs et nuls fusionnés ou non, colonne « Etat saisie » ou non).
+    """
+    header = read_header(path)
+    if FIRST_CANDIDATE_COLUMN not in header:
+        raise ValueError(f"{path} : colonne '{FIRST_CANDIDATE_COLUMN}' introuvable")
+
+    general_cols = [
+        GENERAL_COLUMN_NAMES.get(col, col)
+        for col in header[:header.index(FIRST_CANDIDATE_COLUMN)]
+    ]
+    # ElectionDataFrame insère la colonne de filtre en 3e position
+    # lorsqu'elle est absente du fichier
+    if "etat_saisie" not in general_cols:
+        general_cols.insert(2, "etat_saisie")
+
+    if "nb_blancs_nuls" in general_cols:
+        blancs_nuls_cols = ["nb_blancs_nuls"]
+    else:
+        blancs_nuls_cols = ["nb_blancs", "nb_nuls"]
+
+    return {
+        "n_general_cols": len(general_cols),
+        "general_info_cols": general_cols,
+        "numeric_cols": ["nb_inscrits", "nb_abstentions", "nb_votants"] + blancs_nuls_cols,
+        "filter_column": "etat_saisie",
+        "filter_value": "Complet",
+    }
+
+
+# =====================================================
+# Chargement
+# =====================================================
+def load_election_file(path, drop_rows=(), keep_partial=False, cached=True):
+    """
+    Lit un fichier de résultats et renvoie l'ElectionDataFrame prêt
+    pour ElectionImporter (df_departement, df_stat_elections avec
+    nb_blancs_nuls, df_candidat_resultat).
+
+    keep_partial=True : conserve les départements dont la saisie n'est
+    pas « Complet » (suivi en direct).
+    cached=False : relit la source sans passer par le cache Parquet,
+    pour des fichiers remplacés à chaque remontée.
+    """
+    config = detect_layout(path)
+    config["keep_partial"] = keep_partial
+
+    if path.endswith((".csv", ".txt")):
+        df = pd.read_csv(path, sep=";", encoding="latin-1")
+    elif cached:
+        df = read_excel_cached(path)
+    else:
+        df = pd.read_excel(path)
+    df = df.drop(index=list(drop_rows), errors="ignore")
+    df = df.rename(columns={"Etat saisie": "etat_saisie"})
+
+    edf = ElectionDataFrame(df, config)
+
+    # Fusion blancs + nuls
+    stats = edf.df_stat_elections
+    if "nb_blancs_nuls" not in stats.columns:
+        stats = stats.assign(
+            nb_blancs_nuls=stats["nb_blancs"].fillna(0) + stats["nb_nuls"].fillna(0)
+        ).drop(columns=["nb_blancs", "nb_nuls"])
+    edf.df_stat_elections = stats
+
+    return edf
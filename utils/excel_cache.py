@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import warnings
+
+import pandas as pd
+
+from utils.file_manifest import FileManifest
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+CACHE_DIR = os.environ.get("EXCEL_CACHE_DIR", ".cache/excel")
+
+
+# =====================================================
+# Clés de cache
+# =====================================================
+def options_hash(read_excel_kwargs):
+    """
+    Empreinte stable des options de lecture (header, skiprows, dtype,
+    usecols...) : deux lectures d'une même feuille avec des options
+    différentes ont des entrées de cache distinctes.
+    """
+    options = json.dumps(read_excel_kwargs, sort_keys=True, default=repr)
+    return hashlib.sha256(options.encode()).hexdigest()[:16]
+
+
+def cache_path(file_hash, sheet_name=0, cache_dir=CACHE_DIR, read_excel_kwargs=None):
+    """Fichier Parquet associé à (empreinte du fichier, feuille, options)."""
+    sheet = str(sheet_name).replace(os.sep, "_")
+    name = f"{file_hash}--{sheet}"
+    if read_excel_kwargs:
+        name = f"{name}--{options_hash(read_excel_kwargs)}"
+    return os.path.join(cache_dir, f"{name}.parquet")
+
+
+def typed_frame(df):
+    """
+    Rend un DataFrame Excel sérialisable en Parquet : les colonnes objet
+    à types mélangés (ex: codes département 1, 2, '2A') passent en texte,
+    les valeurs manquantes restent manquantes.
+    """
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].dropna()
+        if values.map(type).nunique() > 1:
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+# =====================================================
+# Lecture
+# =====================================================
+def read_excel_cached(path, sheet_name=0, columns=None, cache_dir=CACHE_DIR,
+                      **read_excel_kwargs):
+    """
+    pd.read_excel avec cache Parquet.
+
+    La première lecture d'une feuille la convertit en Parquet, clé =
+    empreinte SHA-256 du fichier + nom de feuille + options de lecture ;
+    les lectures suivantes lisent le Parquet, en ne chargeant que
+    `columns` si fourni.
+    La première lecture renvoie le Parquet tout juste écrit : mêmes
+    types qu'à la lecture suivante. Sans pyarrow, se replie sur
+    pd.read_excel, avec la même mise en forme (typed_frame).
+    """
+    if not HAS_PARQUET:
+        warnings.warn("pyarrow absent : cache Parquet désactivé", stacklevel=2)
+        df = typed_frame(pd.read_excel(path, sheet_name=sheet_name, **read_excel_kwargs))
+        return df if columns is None else df[columns]
+
+    parquet_path = cache_path(
+        FileManifest.file_hash(path), sheet_name, cache_dir, read_excel_kwargs
+    )
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, columns=columns)
+
+    df = typed_frame(pd.read_excel(path, sheet_name=sheet_name, **read_excel_kwargs))
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{parquet_path}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+
+    # Relu depuis le Parquet : types identiques à ceux des lectures suivantes
+    return pd.read_parquet(parquet_path, columns=columns)
+
+
+# =====================================================
+# Maintenance
+# =====================================================
+def prune_cache(data_dir="data", cache_dir=CACHE_DIR):
+    """
+    Supprime les fichiers de cache dont l'empreinte ne correspond plus
+    à aucun fichier Excel présent sous data_dir.
+    Retourne la liste des fichiers supprimés.
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    current_hashes = {
+        FileManifest.file_hash(os.path.join(root, name))
+        for root, _, names in os.walk(data_dir)
+        for name in names
+        if name.endswith((".xlsx", ".xls"))
+    }
+
+    removed = []
+    for name in os.listdir(cache_dir):
+        if name.split("--", 1)[0] not in current_hashes:
+            os.remove(os.path.join(cache_dir, name))
+            removed.append(name)
+    return removed
@@ -0,0 +1,81 @@
+import hashlib
+import os
+
+from sqlalchemy import func
+from db.session import SessionLocal
+from db.upsert import dialect_insert
+from models import ImportManifest
+
+
+class FileManifest:
+    """
+    Manifeste des fichiers source déjà importés.
+
+    Un fichier dont l'empreinte SHA-256 correspond à un import terminé
+    n'est ni relu ni réimporté (sauf force=True).
+    """
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+
+    # =====================================================
+    # Empreinte
+    # =====================================================
+    @staticmethod
+    def normalize_path(path):
+        return os.path.normpath(path)
+
+    @staticmethod
+    def file_hash(path, block_size=1 << 20):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    # =====================================================
+    # Consultation
+    # =====================================================
+    def stored_hash(self, path):
+        """Empreinte enregistrée au dernier import du fichier (None si jamais importé)."""
+        return (
+            self.session.query(ImportManifest.hash_contenu)
+            .filter_by(chemin=self.normalize_path(path))
+            .scalar()
+        )
+
+    def is_imported(self, path, file_hash=None):
+        """Vrai si le contenu actuel du fichier a déjà été importé."""
+        file_hash = file_hash or self.file_hash(path)
+        return self.stored_hash(path) == file_hash
+
+    def is_modified(self, path, file_hash=None):
+        """Vrai si le fichier a déjà été importé avec un autre contenu."""
+        file_hash = file_hash or self.file_hash(path)
+        stored_hash = self.stored_hash(path)
+        return stored_hash is not None and stored_hash != file_hash
+
+    # =====================================================
+    # Enregistrement
+    # =====================================================
+    def record(self, path, nb_lignes, election_id=None, nb_resultats=None,
+               file_hash=None):
+        """
+        Enregistre (ou met à jour) l'import terminé d'un fichier.
+        À appeler une fois toutes les données du fichier committées.
+        """
+        values = {
+            "hash_contenu": file_hash or self.file_hash(path),
+            "nb_lignes": int(nb_lignes),
+            "nb_resultats": None if nb_resultats is None else int(nb_resultats),
+            "election_id": election_id,
+            "imported_at": func.now(),
+        }
+
+        stmt = dialect_insert(self.session, ImportManifest).values(
+            chemin=self.normalize_path(path), **values
+        )
+        stmt = stmt.on_conflict_do_update(index_elements=["chemin"], set_=values)
+
+        self.session.execute(stmt)
+        self.session.commit()
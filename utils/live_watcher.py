@@ -0,0 +1,248 @@
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import func
+
+from db.upsert import dialect_insert
+from models import RemonteeDepartement, ElectionVersion
+from utils.election_importer import ElectionImporter
+from utils.election_layout import load_election_file
+
+SOURCE_EXTENSIONS = (".xlsx", ".csv", ".txt")
+
+
+class LiveWatcher:
+    """
+    Suivi en direct d'un tour (soir d'élection).
+
+    Un répertoire de dépôt est scruté à intervalle fixe ; à chaque
+    nouvelle version du fichier de résultats, seuls les départements
+    dont la ligne source a changé (empreinte) sont réimportés : stats
+    écrasées, résultats appliqués en différentiel. L'état de saisie et
+    l'horodatage de chaque département sont tenus dans
+    remontee_departement, et election_version est incrémentée une fois
+    les données committées : les caches en aval s'indexent sur cette
+    version.
+    """
+
+    DEFAULT_INTERVAL = 10  # secondes entre deux scrutations
+    SETTLE_SECONDS = 2  # un fichier plus récent est peut-être en cours d'écriture
+
+    def __init__(self, election_config, tour, drop_dir, session=None,
+                 importer=None, interval=None):
+        self.importer = importer or ElectionImporter(session=session)
+        self.session = self.importer.session
+        self.drop_dir = drop_dir
+        self.interval = interval or self.DEFAULT_INTERVAL
+        self.last_seen = None
+
+        tour_config = election_config["tours"][tour]
+        self.election_id = self.importer.get_or_create_election(
+            election_date=tour_config["date"],
+            type_election=election_config["type_election"],
+            tour=tour
+        ).id
+
+    # =====================================================
+    # Scrutation du répertoire de dépôt
+    # =====================================================
+    def latest_file(self):
+        """
+        Fichier source le plus récent et stable du répertoire :
+        (chemin, mtime_ns, taille), ou None. Un simple stat par entrée,
+        le fichier n'est lu que s'il a changé.
+        """
+        limit = time.time_ns() - self.SETTLE_SECONDS * 1_000_000_000
+        latest = None
+        with os.scandir(self.drop_dir) as entries:
+            for entry in entries:
+                if (
+                    not entry.is_file()
+                    or entry.name.startswith((".", "~$"))
+                    or not entry.name.endswith(SOURCE_EXTENSIONS)
+                ):
+                    continue
+                stat = entry.stat()
+                if stat.st_mtime_ns > limit:
+                    continue
+                if latest is None or stat.st_mtime_ns > latest[1]:
+                    latest = (entry.path, stat.st_mtime_ns, stat.st_size)
+        return latest
+
+    # =====================================================
+    # Empreintes
+    # =====================================================
+    @staticmethod
+    def normalized_text(values):
+        """
+        Projection texte stable d'une colonne source : nombres écrits
+        en float (12, 12.0 et '12' donnent la même valeur, qu'une case
+        vide ait fait passer la colonne en float ou en objet), texte
+        nettoyé, valeurs manquantes -> chaîne vide.
+        """
+        numbers = pd.to_numeric(values, errors="coerce")
+        text = values.astype("string").str.strip().fillna("")
+        return text.where(numbers.isna(), numbers.astype("float64").map(repr))
+
+    @classmethod
+    def fingerprints(cls, df, codes):
+        """
+        Empreinte de chaque ligne source, indexée par code département.
+        Calculée sur une projection normalisée (colonnes prises par
+        position, types et valeurs manquantes uniformisés) : seules les
+        lignes dont une valeur a changé changent d'empreinte, quels que
+        soient les dtypes déduits pour le reste du fichier.
+        """
+        projection = pd.DataFrame({
+            position: cls.normalized_text(df.iloc[:, position])
+            for position in range(df.shape[1])
+        })
+        empreintes = pd.Series(
+            pd.util.hash_pandas_object(projection, index=False).to_numpy().view("int64"),
+            index=codes.to_numpy()
+        )
+        return empreintes[~empreintes.index.duplicated(keep="last")]
+
+    # =====================================================
+    # Rafraîchissement
+    # =====================================================
+    def refresh(self):
+        """
+        Un cycle : importe la dernière version du fichier si elle est
+        nouvelle. Retourne None si rien n'a changé, sinon un résumé
+        {"fichier", "version", "departements", "inserted", "updated",
+        "quarantaine", ...}.
+        """
+        latest = self.latest_file()
+        if latest is None or latest == self.last_seen:
+            return None
+        path = latest[0]
+
+        edf = load_election_file(path, keep_partial=True, cached=False)
+
+        codes = ElectionImporter.normalize_codes(edf.df["Code du département"])
+        empreintes = self.fingerprints(edf.df, codes)
+
+        stored = dict(
+            self.session.query(
+                RemonteeDepartement.code_dept, RemonteeDepartement.empreinte
+            ).filter_by(election_id=self.election_id)
+        )
+        changed = [
+            code for code, empreinte in empreintes.items()
+            if stored.get(code) != empreinte
+        ]
+        self.last_seen = latest
+        if not changed:
+            return None
+
+        quarantined = self.importer.validator.quarantined
+        before = quarantined.total()
+        summary = {"fichier": path, "departements": len(changed)}
+        summary.update(self.import_departements(edf, changed))
+        summary["quarantaine"] = quarantined.total() - before
+
+        etats = dict(zip(
+            ElectionImporter.normalize_codes(edf.df_infos_general["code_dept"]),
+            edf.df_infos_general["etat_saisie"]
+        ))
+        summary["version"] = self.publish(
+            {code: (etats.get(code, ""), int(empreintes[code])) for code in changed}
+        )
+        return summary
+
+    def import_departements(self, edf, codes):
+        """Réimporte départements, stats et résultats des seuls codes donnés."""
+        df_departement = edf.df_departement[edf.df_departement["code_dept"].isin(codes)]
+        if not df_departement.empty:
+            self.importer.import_departements(df_departement)
+
+        # Stats encore incomplètes (cases vides) : non écrites, les
+        # valeurs déjà stockées sont conservées jusqu'à la remontée suivante
+        df_stats = edf.df_stat_elections[
+            edf.df_stat_elections["code_dept"].isin(codes)
+        ].dropna(subset=ElectionImporter.STATS_COLUMNS)
+        if not df_stats.empty:
+            self.importer.import_stats(
+                df_stats, self.election_id, on_conflict="overwrite"
+            )
+
+        df_resultats = edf.df_candidat_resultat[
+            edf.df_candidat_resultat["Code du département"].isin(codes)
+        ].dropna(subset=["Nom", "Voix"])
+        return self.importer.import_candidats_resultats_delta(
+            df_resultats, self.election_id
+        )
+
+    def publish(self, remontees):
+        """
+        Enregistre l'état de saisie des départements modifiés et
+        incrémente la version de l'élection, dans une même transaction.
+        Retourne la nouvelle version.
+        """
+        version = (
+            self.session.query(ElectionVersion.version)
+            .filter_by(election_id=self.election_id)
+            .scalar() or 0
+        ) + 1
+
+        stmt = dialect_insert(self.session, RemonteeDepartement)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["election_id", "code_dept"],
+            set_={
+                "etat_saisie": stmt.excluded.etat_saisie,
+                "empreinte": stmt.excluded.empreinte,
+                "version": stmt.excluded.version,
+                "updated_at": func.now(),
+            }
+        )
+        self.session.execute(stmt, [
+            {
+                "election_id": self.election_id,
+                "code_dept": code,
+                "etat_saisie": etat,
+                "empreinte": empreinte,
+                "version": version,
+            }
+            for code, (etat, empreinte) in remontees.items()
+        ])
+
+        stmt = dialect_insert(self.session, ElectionVersion).values(
+            election_id=self.election_id, version=version
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["election_id"],
+            set_={"version": stmt.excluded.version, "updated_at": func.now()}
+        )
+        self.session.execute(stmt)
+        self.session.commit()
+        return version
+
+    # =====================================================
+    # Boucle de suivi
+    # =====================================================
+    def watch(self, max_cycles=None):
+        """
+        Scrute le répertoire toutes les `interval` secondes (cadence
+        fixe : la durée du cycle est déduite de l'attente).
+        """
+        cycle = 0
+        while max_cycles is None or cycle < max_cycles:
+            started = time.monotonic()
+            summary = self.refresh()
+            elapsed = time.monotonic() - started
+            if summary:
+                print(
+                    f"📡 {datetime.now():%H:%M:%S} v{summary['version']} "
+                    f"{os.path.basename(summary['fichier'])} : "
+                    f"{summary['departements']} département(s), "
+                    f"{summary['inserted']} ajoutés, {summary['updated']} modifiés "
+                    f"({elapsed:.2f} s)"
+                )
+                if summary["quarantaine"]:
+                    print(f"⚠️  {summary['quarantaine']} ligne(s) mise(s) en quarantaine")
+            cycle += 1
+            if max_cycles is None or cycle < max_cycles:
+                time.sleep(max(0.0, self.interval - elapsed))
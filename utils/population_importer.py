@@ -0,0 +1,195 @@
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from db.bulk import bulk_insert
+from db.session import SessionLocal
+from models import Departement, PopulationDepartement, Sexe, TrancheAge
+from utils.excel_cache import read_excel_cached
+from utils.validation import PreInsertValidator
+
+POPULATION_DIR = "./data/populations/source"
+
+# Blocs de colonnes du fichier INSEE (libellé de la 1re colonne du bloc)
+SEXE_BLOCKS = {"ENSEMBLE": "Ensemble", "H": "Hommes", "F": "Femmes"}
+
+TRANCHES_AGE_MAP = {
+    "0 à 19 ans": (0, 19),
+    "20 à 39 ans": (20, 39),
+    "40 à 59 ans": (40, 59),
+    "60 à 74 ans": (60, 74),
+    "75 ans et plus": (75, None),
+}
+
+# Codes INSEE outre-mer -> codes département de la base (codes électoraux)
+DOM_CODES_MAP = {
+    "971": "ZA",  # Guadeloupe
+    "972": "ZB",  # Martinique
+    "973": "ZC",  # Guyane
+    "974": "ZD",  # La Réunion
+    "975": "ZS",  # Saint-Pierre-et-Miquelon
+    "976": "ZW",  # Mayotte
+    "977": "ZX",  # Saint-Barthélemy
+    "978": "ZZ",  # Saint-Martin
+    "986": "ZR",  # Wallis-et-Futuna
+    "987": "ZQ",  # Polynésie française
+    "988": "ZM",  # Nouvelle-Calédonie
+}
+
+
+# =====================================================
+# Lecture d'un fichier annuel (exécutable dans un worker)
+# =====================================================
+def year_of(path):
+    match = re.search(r"(\d{4})", os.path.basename(path))
+    if not match:
+        raise ValueError(f"{path} : année introuvable dans le nom du fichier")
+    return int(match.group(1))
+
+
+def parse_population_file(path, sexes=("H", "F")):
+    """
+    Lit un fichier pop-AAAA.xlsx et le passe en forme longue par melt :
+    colonnes code_dept, sexe, tranche_age, annee, population.
+    La 1re ligne de données porte les libellés des tranches d'âge,
+    les colonnes « Total » sont ignorées.
+    """
+    raw = read_excel_cached(path)
+    header = raw.columns.tolist()
+    tranches = raw.iloc[0]
+    data = raw.iloc[1:]
+
+    codes = data.iloc[:, 0].astype(str).str.strip()
+    data = data[codes.str.fullmatch(r"\d+|2[AB]")]
+    codes = codes[data.index].replace(DOM_CODES_MAP)
+    codes = codes.where(~codes.str.isdigit(), codes.str.zfill(2))
+
+    frames = []
+    for sexe in sexes:
+        start = header.index(SEXE_BLOCKS[sexe])
+        columns = [
+            i for i in range(start, start + len(TRANCHES_AGE_MAP) + 1)
+            if tranches.iloc[i] in TRANCHES_AGE_MAP
+        ]
+        block = data.iloc[:, columns]
+        block.columns = [tranches.iloc[i] for i in columns]
+        frames.append(
+            block.assign(code_dept=codes.to_numpy(), sexe=sexe)
+            .melt(id_vars=["code_dept", "sexe"], var_name="tranche_age",
+                  value_name="population")
+        )
+
+    df = pd.concat(frames, ignore_index=True)
+    df["population"] = pd.to_numeric(df["population"], errors="coerce").fillna(0).astype(int)
+    df["annee"] = year_of(path)
+    return df
+
+
+class PopulationImporter:
+    """
+    Import des populations départementales par sexe et tranche d'âge
+    (un fichier INSEE par année). Les fichiers sont lus en parallèle,
+    les identifiants de sexe et de tranche d'âge sont résolus depuis un
+    cache préchargé, puis population_departement est chargée en masse
+    (COPY sur PostgreSQL, ON CONFLICT DO NOTHING) : l'import est
+    relançable et n'ajoute que les années manquantes.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+        self.validator = PreInsertValidator(self.session)
+
+    # =====================================================
+    # Dimensions
+    # =====================================================
+    def preload_dimensions(self):
+        """
+        Crée les sexes (ENSEMBLE, H, F, comme l'amorçage du notebook,
+        quel que soit le bloc chargé) et tranches d'âge manquants puis
+        renvoie ({code sexe: id}, {libellé tranche: id}).
+        """
+        sexe_ids = dict(self.session.query(Sexe.code, Sexe.id))
+        for code in SEXE_BLOCKS:
+            if code not in sexe_ids:
+                self.session.add(Sexe(code=code))
+
+        tranche_ids = {
+            (age_min, age_max): tranche_id
+            for tranche_id, age_min, age_max in self.session.query(
+                TrancheAge.id, TrancheAge.age_min, TrancheAge.age_max
+            )
+        }
+        for age_min, age_max in TRANCHES_AGE_MAP.values():
+            if (age_min, age_max) not in tranche_ids:
+                self.session.add(TrancheAge(age_min=age_min, age_max=age_max))
+
+        if self.session.new:
+            self.session.commit()
+            return self.preload_dimensions()
+
+        return sexe_ids, {
+            label: tranche_ids[bornes] for label, bornes in TRANCHES_AGE_MAP.items()
+        }
+
+    # =====================================================
+    # Import
+    # =====================================================
+    @staticmethod
+    def parse_files(paths, workers=None, sexes=("H", "F")):
+        """Lit les fichiers annuels en parallèle (un processus par fichier)."""
+        if workers == 1 or len(paths) == 1:
+            frames = [parse_population_file(path, sexes) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(
+                    parse_population_file, paths, [sexes] * len(paths)
+                ))
+        return pd.concat(frames, ignore_index=True)
+
+    def import_dataframe(self, df, sexes=("H", "F")):
+        """
+        Charge un DataFrame long (code_dept, sexe, tranche_age, annee,
+        population). Retourne {"lignes": n, "inserees": n,
+        "departements_inconnus": [...]}.
+        """
+        sexe_ids, tranche_ids = self.preload_dimensions()
+
+        codes = set(df["code_dept"].unique())
+        connus = {
+            code for (code,) in self.session.query(Departement.code_dept)
+            .filter(Departement.code_dept.in_(codes))
+        }
+        df = df[df["code_dept"].isin(connus)]
+
+        df_population = pd.DataFrame({
+            "departement_code": df["code_dept"],
+            "sexe_id": df["sexe"].map(sexe_ids),
+            "tranche_age_id": df["tranche_age"].map(tranche_ids),
+            "annee": df["annee"],
+            "population": df["population"],
+        })
+
+        df_population = self.validator.validate(
+            PopulationDepartement.__table__, df_population
+        )
+
+        inserees = bulk_insert(
+            self.session,
+            PopulationDepartement.__table__,
+            df_population,
+            ["departement_code", "sexe_id", "tranche_age_id", "annee"]
+        )
+        self.session.commit()
+
+        return {
+            "lignes": len(df_population),
+            "inserees": inserees,
+            "departements_inconnus": sorted(codes - connus),
+        }
+
+    def import_files(self, paths=None, workers=None, sexes=("H", "F")):
+        paths = paths or sorted(glob.glob(os.path.join(POPULATION_DIR, "*.xlsx")))
+        return self.import_dataframe(self.parse_files(paths, workers, sexes), sexes)
@@ -0,0 +1,161 @@
+import pandas as pd
+
+from db.bulk import execute_frame
+from db.session import SessionLocal
+from db.upsert import dialect_insert
+from models import FaitSecurite, Indicateur, UniteDeCompte
+from utils.chunked_reader import iter_source_chunks
+from utils.population_importer import DOM_CODES_MAP
+from utils.validation import PreInsertValidator
+
+SECURITE_FILE = "./data/securite/securite.xlsx"
+
+# Colonnes du fichier SSMSI -> colonnes fait_securite
+SECURITE_COLUMN_NAMES = {
+    "Code_departement": "departement_code",
+    "annee": "annee",
+    "indicateur": "indicateur",
+    "unite_de_compte": "unite_de_compte",
+    "nombre": "nombre",
+    "taux_pour_mille": "taux_pour_mille",
+}
+FAIT_KEY = ["departement_code", "annee", "indicateur_id", "unite_de_compte_id"]
+
+
+class SecuriteImporter:
+    """
+    Import en flux des faits de sécurité départementaux (fichier SSMSI).
+
+    La feuille est lue par paquets de chunk_size lignes (mémoire
+    constante), les libellés d'indicateur et d'unité de compte sont
+    résolus depuis des caches en mémoire (les manquants sont créés en un
+    seul INSERT par paquet) et chaque paquet est chargé par un upsert sur
+    ix_fait_securite_dept_annee_indicateur_unite : le fichier de l'année
+    suivante se recharge sans purge.
+    """
+
+    DEFAULT_CHUNK_SIZE = 5_000
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+        self.indicateurs = {}
+        self.unites = {}
+        self.validator = PreInsertValidator(self.session)
+
+    # =====================================================
+    # Dimensions
+    # =====================================================
+    def preload_dimensions(self):
+        self.indicateurs = dict(self.session.query(Indicateur.libelle, Indicateur.id))
+        self.unites = dict(self.session.query(UniteDeCompte.libelle, UniteDeCompte.id))
+
+    def resolve_libelles(self, libelles, model, cache):
+        """
+        Ids des libellés donnés ; les libellés inconnus sont insérés en un
+        seul INSERT ... ON CONFLICT DO NOTHING puis relus.
+        """
+        manquants = sorted(set(libelles.unique()) - cache.keys())
+        if manquants:
+            stmt = dialect_insert(self.session, model.__table__).on_conflict_do_nothing(
+                index_elements=["libelle"]
+            )
+            self.session.execute(stmt, [{"libelle": libelle} for libelle in manquants])
+            cache.update(
+                self.session.query(model.libelle, model.id)
+                .filter(model.libelle.in_(manquants))
+            )
+        return libelles.map(cache)
+
+    # =====================================================
+    # Préparation d'un paquet
+    # =====================================================
+    @staticmethod
+    def normalize_codes(codes):
+        """
+        Codes INSEE (1, 1.0, '01', '2A', 971...) -> codes de la base
+        ('01', '2A', 'ZA'...).
+        """
+        numeric = pd.to_numeric(codes, errors="coerce")
+        codes_str = codes.astype(str).str.strip().str.upper()
+        codes_str = codes_str.where(
+            numeric.isna(), numeric.astype("Int64").astype(str)
+        ).replace(DOM_CODES_MAP)
+        return codes_str.where(~codes_str.str.isdigit(), codes_str.str.zfill(2))
+
+    @staticmethod
+    def normalize_libelles(libelles):
+        """Libellés nettoyés ; manquants ou vides -> NA (jamais 'nan')."""
+        libelles = libelles.astype("string").str.strip()
+        return libelles.mask(libelles == "")
+
+    def prepare_chunk(self, raw, header):
+        df = pd.DataFrame({
+            name: raw[header.index(col)]
+            for col, name in SECURITE_COLUMN_NAMES.items()
+        })
+        df_faits = pd.DataFrame({
+            "departement_code": self.normalize_codes(df["departement_code"]),
+            "annee": pd.to_numeric(df["annee"], errors="coerce").astype("Int64"),
+            "indicateur": self.normalize_libelles(df["indicateur"]),
+            "unite_de_compte": self.normalize_libelles(df["unite_de_compte"]),
+            "nombre": pd.to_numeric(df["nombre"], errors="coerce").astype("Int64"),
+            "taux_pour_mille": pd.to_numeric(df["taux_pour_mille"], errors="coerce"),
+        }).drop_duplicates(
+            subset=["departement_code", "annee", "indicateur", "unite_de_compte"],
+            keep="last"
+        )
+
+        # Codes inconnus, valeurs ou libellés manquants, valeurs négatives :
+        # quarantaine, avant toute création de dimension
+        df_faits = self.validator.validate(FaitSecurite.__table__, df_faits, extra={
+            "nn_fait_securite_indicateur_id": df_faits["indicateur"].isna().to_numpy(),
+            "nn_fait_securite_unite_de_compte_id":
+                df_faits["unite_de_compte"].isna().to_numpy(),
+        })
+
+        # Libellés résolus (et créés si besoin) sur les seules lignes valides
+        return df_faits.assign(
+            indicateur_id=self.resolve_libelles(
+                df_faits["indicateur"], Indicateur, self.indicateurs
+            ),
+            unite_de_compte_id=self.resolve_libelles(
+                df_faits["unite_de_compte"], UniteDeCompte, self.unites
+            ),
+        )[FAIT_KEY + ["nombre", "taux_pour_mille"]]
+
+    # =====================================================
+    # Import
+    # =====================================================
+    def upsert_faits(self, df):
+        """Upsert d'un paquet ; seules les valeurs modifiées sont réécrites."""
+        if df.empty:
+            return 0
+        table = FaitSecurite.__table__
+        stmt = dialect_insert(self.session, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=FAIT_KEY,
+            set_={
+                "nombre": stmt.excluded.nombre,
+                "taux_pour_mille": stmt.excluded.taux_pour_mille,
+            },
+            where=(table.c.nombre != stmt.excluded.nombre)
+            | (table.c.taux_pour_mille != stmt.excluded.taux_pour_mille)
+        )
+        return execute_frame(self.session, stmt, df)
+
+    def import_file(self, path=SECURITE_FILE, chunk_size=None):
+        """
+        Importe le fichier paquet par paquet, un commit par paquet.
+        Retourne {"lignes": n, "faits": n} (lignes lues, faits chargés).
+        """
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        header, chunks = iter_source_chunks(path, chunk_size)
+        self.preload_dimensions()
+
+        lignes = faits = 0
+        for raw in chunks:
+            lignes += len(raw)
+            faits += self.upsert_faits(self.prepare_chunk(raw, header))
+            self.session.commit()
+
+        return {"lignes": lignes, "faits": faits}
@@ -0,0 +1,352 @@
+import json
+import operator
+import re
+from collections import Counter
+from functools import lru_cache
+
+import pandas as pd
+from sqlalchemy import CheckConstraint
+
+from db.session import SessionLocal
+from models import Departement, ImportQuarantaine
+
+# =====================================================
+# Traduction des CheckConstraint en expressions pandas
+# =====================================================
+# Sous-ensemble SQL couvert (celui des modèles) : comparaisons, AND / OR /
+# NOT, IS [NOT] NULL, [NOT] BETWEEN, [NOT] IN (...), length(), trim(),
+# lower(), upper(), littéraux numériques et chaînes. La logique est
+# ternaire comme en SQL : une contrainte n'échoue que si elle vaut FALSE
+# (NULL est accepté).
+
+TOKEN = re.compile(
+    r"\s*(?:(?P<num>\d+(?:\.\d+)?)|'(?P<str>[^']*)'|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<op><=|>=|<>|!=|=|<|>|\(|\)|,))"
+)
+COMPARATORS = {
+    "=": operator.eq, "<>": operator.ne, "!=": operator.ne,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+FUNCTIONS = {
+    "length": lambda s: s.astype("string").str.len(),
+    "trim": lambda s: s.astype("string").str.strip(),
+    "lower": lambda s: s.astype("string").str.lower(),
+    "upper": lambda s: s.astype("string").str.upper(),
+}
+
+
+def tokenize(sql):
+    sql = sql.strip()
+    tokens, position = [], 0
+    while position < len(sql):
+        match = TOKEN.match(sql, position)
+        if not match:
+            raise ValueError(f"Expression non prise en charge : {sql!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name" and value.upper() in {"AND", "OR", "NOT", "IS", "NULL", "BETWEEN", "IN"}:
+            kind, value = "kw", value.upper()
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+def to_boolean(values, index, unknown):
+    """Série booléenne nullable : NA là où la comparaison porte sur NULL."""
+    result = pd.Series(values, index=index, dtype="boolean")
+    if isinstance(unknown, pd.Series):
+        return result.mask(unknown)
+    return result.mask(pd.Series(bool(unknown), index=index))
+
+
+def isna(value):
+    return value.isna() if isinstance(value, pd.Series) else pd.isna(value)
+
+
+class CheckParser:
+    """
+    Analyseur descendant récursif : renvoie (fonction df -> Série
+    booléenne nullable, colonnes utilisées).
+    """
+
+    def __init__(self, sql):
+        self.tokens = tokenize(sql)
+        self.position = 0
+        self.columns = set()
+
+    def parse(self):
+        expression = self.parse_or()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Jeton inattendu : {self.tokens[self.position]}")
+        return expression, self.columns
+
+    # ---------- utilitaires ----------
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def accept(self, kind, value=None):
+        token = self.peek()
+        if token[0] == kind and (value is None or token[1] == value):
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, kind, value=None):
+        if not self.accept(kind, value):
+            raise ValueError(f"{value or kind} attendu, trouvé {self.peek()}")
+
+    # ---------- logique ----------
+    def parse_or(self):
+        left = self.parse_and()
+        while self.accept("kw", "OR"):
+            left = (lambda a, b: lambda df: a(df) | b(df))(left, self.parse_and())
+        return left
+
+    def parse_and(self):
+        left = self.parse_not()
+        while self.accept("kw", "AND"):
+            left = (lambda a, b: lambda df: a(df) & b(df))(left, self.parse_not())
+        return left
+
+    def parse_not(self):
+        if self.accept("kw", "NOT"):
+            inner = self.parse_not()
+            return lambda df: ~inner(df)
+        return self.parse_predicate()
+
+    # ---------- prédicats ----------
+    def parse_predicate(self):
+        if self.accept("op", "("):
+            inner = self.parse_or()
+            self.expect("op", ")")
+            return inner
+
+        left = self.parse_operand()
+
+        if self.accept("kw", "IS"):
+            negate = self.accept("kw", "NOT")
+            self.expect("kw", "NULL")
+            return lambda df: to_boolean(isna(left(df)) != negate, df.index, False)
+
+        negate = self.accept("kw", "NOT")
+        if self.accept("kw", "BETWEEN"):
+            low = self.parse_operand()
+            self.expect("kw", "AND")
+            high = self.parse_operand()
+            between = lambda df: (
+                self.compare(operator.ge, left, low, df)
+                & self.compare(operator.le, left, high, df)
+            )
+            return (lambda df: ~between(df)) if negate else between
+
+        if self.accept("kw", "IN"):
+            self.expect("op", "(")
+            values = [self.literal()]
+            while self.accept("op", ","):
+                values.append(self.literal())
+            self.expect("op", ")")
+
+            def member(df):
+                value = left(df)
+                return to_boolean(value.isin(values), df.index, value.isna())
+            return (lambda df: ~member(df)) if negate else member
+
+        kind, symbol = self.peek()
+        if kind == "op" and symbol in COMPARATORS:
+            self.position += 1
+            right = self.parse_operand()
+            return lambda df: self.compare(COMPARATORS[symbol], left, right, df)
+
+        raise ValueError(f"Prédicat non pris en charge près de {self.peek()}")
+
+    @staticmethod
+    def compare(op, left, right, df):
+        a, b = left(df), right(df)
+        return to_boolean(op(a, b), df.index, isna(a) | isna(b))
+
+    # ---------- opérandes ----------
+    def is_function_call(self, offset=0):
+        kind, value = self.peek(offset)
+        return kind == "name" and value.lower() in FUNCTIONS and self.peek(offset + 1) == ("op", "(")
+
+    def literal(self):
+        kind, value = self.peek()
+        self.position += 1
+        if kind == "num":
+            return float(value) if "." in value else int(value)
+        if kind == "str":
+            return value
+        raise ValueError(f"Littéral attendu, trouvé {(kind, value)}")
+
+    def parse_operand(self):
+        kind, value = self.peek()
+        if self.is_function_call():
+            self.position += 2
+            argument = self.parse_operand()
+            self.expect("op", ")")
+            function = FUNCTIONS[value.lower()]
+            return lambda df: function(argument(df))
+        if kind == "name":
+            self.position += 1
+            self.columns.add(value)
+            return lambda df: df[value]
+        constant = self.literal()
+        return lambda df: constant
+
+
+# =====================================================
+# Règles par table
+# =====================================================
+@lru_cache(maxsize=None)
+def table_rules(table):
+    """
+    Règles d'une table : [(nom, colonnes, fonction df -> Série booléenne
+    nullable)], issues de ses CheckConstraint et des colonnes NOT NULL
+    sans valeur par défaut.
+    """
+    rules = []
+    for constraint in table.constraints:
+        if isinstance(constraint, CheckConstraint):
+            check, columns = CheckParser(str(constraint.sqltext)).parse()
+            rules.append((constraint.name, frozenset(columns), check))
+
+    for column in table.columns:
+        if column.nullable or column.default is not None or column.server_default is not None:
+            continue
+        rules.append((
+            f"nn_{table.name}_{column.name}",
+            frozenset([column.name]),
+            (lambda name: lambda df: df[name].notna().astype("boolean"))(column.name),
+        ))
+    return rules
+
+
+def check_frame(table, df):
+    """
+    Évalue colonne par colonne les règles applicables au DataFrame
+    (celles dont toutes les colonnes sont présentes). Renvoie un
+    DataFrame booléen : une colonne par règle, True = violation.
+    """
+    failures = {
+        name: check(df).eq(False).fillna(False).to_numpy(dtype=bool)
+        for name, columns, check in table_rules(table)
+        if columns <= set(df.columns)
+    }
+    return pd.DataFrame(failures, index=df.index)
+
+
+# =====================================================
+# Validation et quarantaine
+# =====================================================
+class PreInsertValidator:
+    """
+    Étape de validation exécutée sur les DataFrames préparés, avant tout
+    envoi SQL : contraintes CHECK et NOT NULL des modèles, plus règles
+    inter-tables (code_dept connu, somme des voix <= votants). Les lignes
+    invalides sont écartées et conservées dans import_quarantaine, au
+    lieu de faire échouer toute l'unité de travail au commit.
+    """
+
+    def __init__(self, session=None):
+        self.session = session or SessionLocal()
+        self.known_codes = None
+        self.quarantined = Counter()  # table cible -> lignes écartées
+
+    # =====================================================
+    # Règles inter-tables
+    # =====================================================
+    def add_known_codes(self, codes):
+        self.load_known_codes()
+        self.known_codes.update(codes)
+
+    def load_known_codes(self):
+        if self.known_codes is None:
+            self.known_codes = {
+                code for (code,) in self.session.query(Departement.code_dept)
+            }
+        return self.known_codes
+
+    def unknown_codes(self, df, column):
+        return ~df[column].isin(self.load_known_codes())
+
+    @staticmethod
+    def department_columns(table):
+        """Colonnes de `table` référençant departements.code_dept."""
+        return [
+            column.name for column in table.columns
+            if any(fk.target_fullname == "departements.code_dept"
+                   for fk in column.foreign_keys)
+        ]
+
+    @staticmethod
+    def voix_above_votants(df_resultats, df_stats, keys):
+        """
+        Clés (ex: code_dept) dont la somme des voix dépasse nb_votants :
+        renvoie les masques (résultats, stats) des lignes concernées.
+        """
+        voix = df_resultats.groupby(keys, sort=False)["nb_voix"].sum()
+        votants = df_stats.drop_duplicates(subset=keys).set_index(keys)["nb_votants"]
+        excess = (voix.reindex(votants.index) > votants).fillna(False).astype(bool)
+        bad = excess[excess].index
+        if len(keys) == 1:
+            return (
+                df_resultats[keys[0]].isin(bad).to_numpy(),
+                df_stats[keys[0]].isin(bad).to_numpy(),
+            )
+        return (
+            pd.MultiIndex.from_frame(df_resultats[keys]).isin(bad),
+            pd.MultiIndex.from_frame(df_stats[keys]).isin(bad),
+        )
+
+    # =====================================================
+    # Validation
+    # =====================================================
+    def validate(self, table, df, election_id=None, extra=None):
+        """
+        Renvoie les lignes valides de df pour `table` ; les autres sont
+        mises en quarantaine. extra : {nom de règle: masque de violation}
+        calculé par l'appelant (règles inter-tables).
+        """
+        if df.empty:
+            return df
+
+        failures = check_frame(table, df)
+        for column in self.department_columns(table):
+            if column in df.columns:
+                failures["fk_code_dept_inconnu"] = self.unknown_codes(df, column).to_numpy()
+        for name, mask in (extra or {}).items():
+            failures[name] = mask
+
+        is_bad = failures.any(axis=1).to_numpy()
+        if not is_bad.any():
+            return df
+
+        self.quarantine(table.name, df[is_bad], failures[is_bad], election_id)
+        return df[~is_bad]
+
+    def quarantine(self, cible, df_bad, failures, election_id=None):
+        """
+        Enregistre les lignes rejetées dans import_quarantaine (règles
+        violées + données en JSON). Retourne le nombre de lignes ; le
+        cumul par table est tenu dans self.quarantined, que les scripts
+        affichent.
+        """
+        rules = failures.apply(
+            lambda row: ",".join(row.index[row.to_numpy()]), axis=1
+        )
+        rows = json.loads(df_bad.to_json(orient="records", date_format="iso"))
+        self.session.execute(
+            ImportQuarantaine.__table__.insert(),
+            [
+                {
+                    "cible": cible,
+                    "election_id": election_id,
+                    "regles": regles,
+                    "donnees": donnees,
+                }
+                for regles, donnees in zip(rules, rows)
+            ]
+        )
+        self.quarantined[cible] += len(rows)
+        return len(rows)
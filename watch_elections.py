@@ -0,0 +1,58 @@
+# =====================================================
+# Suivi en direct d'un tour (soir d'élection)
+# =====================================================
+#
+# Usage :
+#   python watch_elections.py presidentielle-2022 --tour 1 --dir data/live
+#   python watch_elections.py presidentielle-2022 --tour 2 --dir data/live --interval 5
+
+import argparse
+
+from db import SessionLocal
+from utils.election_configs import ELECTIONS
+from utils.live_watcher import LiveWatcher
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Import en direct des remontées partielles d'un tour"
+    )
+    parser.add_argument("election", choices=list(ELECTIONS))
+    parser.add_argument("--tour", type=int, default=1, help="Tour suivi")
+    parser.add_argument(
+        "--dir",
+        required=True,
+        help="Répertoire de dépôt des versions successives du fichier"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=LiveWatcher.DEFAULT_INTERVAL,
+        help="Secondes entre deux scrutations"
+    )
+    parser.add_argument(
+        "--cycles",
+        type=int,
+        help="Nombre de cycles avant arrêt (illimité par défaut)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    session = SessionLocal("bulk")
+    try:
+        watcher = LiveWatcher(
+            ELECTIONS[args.election], args.tour, args.dir,
+            session=session, interval=args.interval
+        )
+        print(f"👀 Suivi de {args.dir} (toutes les {args.interval} s)")
+        watcher.watch(max_cycles=args.cycles)
+    except KeyboardInterrupt:
+        print("\n🛑 Suivi interrompu")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()